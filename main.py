@@ -1,10 +1,12 @@
 import time
 
 import gc
+import micropython
 import network
+import random
+import socket
 import picographics as pg # type: ignore
-from pimoroni import Button  # type: ignore
-import urequests
+from machine import Pin, mem32
 import uasyncio
 import ujson as json
 
@@ -18,6 +20,7 @@ from secrets import WIFI_SSID, WIFI_PASSWORD, WIFI_COUNTRY, API_BASE_URL
 # Set API_BASE_URL in secrets.py (example: http://example.com).
 BASE_URL = API_BASE_URL.rstrip("/")
 LAPS_BASE_URL = BASE_URL + "/v1/laps?session_key=latest"
+BATCH_LAPS_URL = BASE_URL + "/v1/laps/latest?session_key=latest&driver_numbers={}"
 SESSION_RESULT_URL = BASE_URL + "/v1/session_result?session_key=latest"
 MEETINGS_URL = BASE_URL + "/v1/meetings?meeting_key=latest"
 SESSIONS_URL = BASE_URL + "/v1/sessions?session_key=latest"
@@ -29,17 +32,46 @@ CONSTRUCTOR_STANDINGS_URL = (
 )
 
 POLL_INTERVAL_SECONDS = 5
-EVENT_INFO_REFRESH_SECONDS = 60
+POLL_MIN_INTERVAL_MS = 1000
+POLL_MAX_INTERVAL_MS = 10000
+LAP_EXPECTED_WINDOW_MS = 5000
+EVENT_INFO_REFRESH_SECONDS = 300
 STARTUP_DELAY_SECONDS = 1.5
-HTTP_READ_CHUNK_BYTES = 256
+# Every read is a socket call plus Python dispatch, so chunks below ~256 bytes
+# cost throughput; 1 KiB per read stays cheap next to the 4 KiB tail ring.
+HTTP_READ_CHUNK_BYTES = 1024
+KEEP_ALIVE_DRAIN_BYTES = 512  # unread body tail discarded to keep a socket reusable
 HTTP_TAIL_BYTES = 4096
-STANDINGS_READ_CHUNK_BYTES = 128
+HTTP_TIMEOUT_SECONDS = 10
+STANDINGS_READ_CHUNK_BYTES = 512
 STANDINGS_ENTRY_LIMIT = 0
-STANDINGS_REQUEST_HEADERS = {"Connection": "close"}
+STANDINGS_CACHE_TTL_MS = 600000  # standings only change after a session
+STANDINGS_HEADER_KEEP_BYTES = 64  # unmatched header tail kept across chunks
+STANDINGS_OBJECT_BYTES = 512  # initial size of the reused per-entry buffer
 DISPLAY_BRIGHTNESS = 0.4
-BUTTON_POLL_SECONDS = 0.02
-BUTTON_RELEASE_POLL_SECONDS = 0.01
-BUTTON_RELEASE_DEBOUNCE_SECONDS = 0.03
+BUTTON_POLL_MS = 20
+BUTTON_RELEASE_POLL_MS = 10
+BUTTON_RELEASE_DEBOUNCE_MS = 30
+BUTTON_PRESS_SETTLE_MS = 10  # after a press edge, before the pin level is read
+WIFI_POLL_MS = 50
+WIFI_RETRY_MIN_MS = 1000  # first reconnect delay; doubles per failure
+WIFI_RETRY_MAX_MS = 60000
+WIFI_STATUS_MAP = {
+    -3: "Wrong password",
+    -2: "AP not found",
+    -1: "Connect failed",
+    0: "Idle",
+    1: "Connecting",
+    2: "No IP yet",
+    3: "Connected",
+}
+
+LAP_DURATION_KEY = b'"lap_duration"'
+LAP_NUMBER_KEY = b'"lap_number"'
+DRIVER_NUMBER_KEY = b'"driver_number"'
+POSITION_KEY = b'"position"'
+LAP_OBJECT_BYTES = 512  # initial size of the per-lap entry buffer
+LAP_FIELD_BYTES = 24  # longest lap_duration / lap_number literal kept
 
 DRIVER_CODES = {
     1: "NOR",
@@ -66,18 +98,29 @@ DRIVER_CODES = {
     87: "BEAR",
 }
 
-CONSTRUCTOR_SHORT_NAME_PAIRS = (
-    ("mclaren", "MCL"),
-    ("ferrari", "FER"),
-    ("red_bull", "RBR"),
-    ("mercedes", "MER"),
-    ("williams", "WIL"),
-    ("aston_martin", "AST"),
-    ("alpine", "ALP"),
-    ("rb", "RBT"),
-    ("haas", "HAA"),
-    ("sauber", "SAU"),
-)
+# Driver numbers are 1-99, so index codes by number instead of hashing.
+DRIVER_CODE_TABLE = tuple(DRIVER_CODES.get(n) or str(n) for n in range(100))
+# Driver picker entries, built once instead of on every list redraw.
+DRIVER_PICK_NUMBERS = tuple(sorted(DRIVER_CODES.keys()))
+DRIVER_PICK_LABELS = {}
+for _dn in DRIVER_PICK_NUMBERS:
+    DRIVER_PICK_LABELS[_dn] = "{} #{}".format(DRIVER_CODE_TABLE[_dn], _dn)
+# Everything reads the tables above, so drop the source dict rather than
+# keep a second copy on the GC heap.
+del DRIVER_CODES
+
+CONSTRUCTOR_SHORT_NAMES = {
+    "mclaren": "MCL",
+    "ferrari": "FER",
+    "red_bull": "RBR",
+    "mercedes": "MER",
+    "williams": "WIL",
+    "aston_martin": "AST",
+    "alpine": "ALP",
+    "rb": "RBT",
+    "haas": "HAA",
+    "sauber": "SAU",
+}
 
 
 DISPLAY_TYPE = pg.DISPLAY_PICO_DISPLAY_2
@@ -93,6 +136,40 @@ GREEN = display.create_pen(80, 240, 120)
 RED = display.create_pen(255, 80, 80)
 CYAN = display.create_pen(80, 220, 255)
 
+_display_font = None
+_text_width_cache = {}  # (font, scale, text) -> pixel width
+TEXT_WIDTH_CACHE_LIMIT = 64
+_lap_text_cache = {}  # lap duration ms -> "MM:SS.mmm"
+_gap_text_cache = {}  # (duration ms, leader ms) -> "+S.mmm"
+LAP_TEXT_CACHE_LIMIT = 16
+
+
+def set_display_font(font):
+    global _display_font
+    if font != _display_font:
+        display.set_font(font)
+        _display_font = font
+
+
+# Lap-screen reference widths never change, so measure them once at boot.
+set_display_font("bitmap8")
+LAP_DRIVER_COL_WIDTH = display.measure_text("WWW", 2)
+LAP_DURATION_COL_WIDTH = display.measure_text("88:88.888", 2)
+LAP_GAP_COL_WIDTH = display.measure_text("+88.888", 2)
+LAP_GAP_REFERENCE_LEN = len("+88.888")
+LAP_LAP_COL_WIDTH = display.measure_text("lap 88", 2)
+# Indexed by driver number like DRIVER_CODE_TABLE, including the numeric
+# fallback codes, so the lap screen never hashes or measures a code.
+DRIVER_CODE_WIDTH_TABLE = tuple(
+    display.measure_text(_code, 2) for _code in DRIVER_CODE_TABLE
+)
+_lap_layout_cache = {}
+_lap_screen_key = None   # (color, layout, row count) of the frame on screen
+_lap_info_key = None     # (show_event_info, event info) of the frame on screen
+_lap_screen_rows = None  # rows currently drawn, or None to force a full redraw
+_lap_rows_cache_key = None
+_lap_rows_cache = None
+
 event_name = ""
 session_type_name = ""
 circuit_short_name = ""
@@ -100,21 +177,48 @@ country_name = ""
 current_season_year = None
 show_event_info = True
 
-BUTTON_A = Button(12)
-BUTTON_B = Button(13)
-BUTTON_X = Button(14)
-BUTTON_Y = Button(15)
+SIO_GPIO_IN = 0xD0000004  # RP2040/RP2350 SIO input register, one bit per GPIO
+BUTTON_PIN_MASK = (1 << 12) | (1 << 13) | (1 << 14) | (1 << 15)  # active low
+BUTTON_PINS = (("A", 1 << 12), ("X", 1 << 14), ("Y", 1 << 15), ("B", 1 << 13))
 
 _button_pressed = None       # 'A'/'B'/'X'/'Y' or None
 _polling_buttons = True      # False during sync sub-screens
+_button_irq_flag = uasyncio.ThreadSafeFlag()  # set from the GPIO IRQ
+_button_event = uasyncio.Event()  # set once _button_pressed is stored
+_button_edge = bytearray(1)  # set from the GPIO IRQ for the sync UI loops
+
+
+def _on_button_irq(_pin):
+    _button_edge[0] = 1
+    _button_irq_flag.set()
+
+
+# Wake the button task on press edges instead of polling GPIOs every 20ms.
+for _pin_number in (12, 13, 14, 15):
+    Pin(_pin_number, Pin.IN, Pin.PULL_UP).irq(
+        trigger=Pin.IRQ_FALLING,
+        handler=_on_button_irq,
+    )
+_batch_laps_supported = True  # False once the server 404s BATCH_LAPS_URL
 
 ROW_HEIGHT = 28
 VISIBLE_ROWS = (HEIGHT - 12) // ROW_HEIGHT - 1  # minus title row
+# Top y of each list row below the title; one spare entry marks the end of
+# the last row.
+ROW_YS = tuple(
+    12 + ROW_HEIGHT * (i + 1)
+    for i in range(max(VISIBLE_ROWS, TRACKED_DRIVER_COUNT) + 1)
+)
 MAIN_SCREEN_DRIVER_GAP = 1
 STANDINGS_POS_NAME_GAP = 12
 STANDINGS_NAME_POINTS_GAP = 6
 CONSTRUCTOR_STANDINGS_NAME_POINTS_GAP = 10
 NO_STANDINGS_MESSAGE = "No standings available"
+STANDING_POSITION_KEYS = ("position", "positionText")
+STANDING_POSITION_TEXTS = tuple("P{:02d}".format(i) for i in range(100))
+STANDING_WINS_TEXTS = {}
+for _wins in range(30):
+    STANDING_WINS_TEXTS[str(_wins)] = "W{}".format(_wins)
 
 
 def event_info_snapshot():
@@ -137,12 +241,56 @@ def standings_title_with_current_year(base_title):
     return "{} {}".format(base_title, time.localtime()[0])
 
 
+def driver_pick_label(driver_number):
+    label = DRIVER_PICK_LABELS.get(driver_number)
+    if label is None:
+        label = "{} #{}".format(format_driver_code(driver_number), driver_number)
+    return label
+
+
 def format_driver_code(driver_number):
-    return DRIVER_CODES[int(driver_number)]
+    # Callers pass ints from TRACKED_DRIVERS / DRIVER_PICK_NUMBERS.
+    if 0 <= driver_number < len(DRIVER_CODE_TABLE):
+        return DRIVER_CODE_TABLE[driver_number]
+    return str(driver_number)
+
+
+_driver_url_cache = {}  # driver number -> laps URL; at most 100 entries
+_batch_url_cache_key = None
+_batch_url_cache = None
 
 
 def api_url_for_driver(driver_number):
-    return LAPS_BASE_URL + "&driver_number={}".format(driver_number)
+    url = _driver_url_cache.get(driver_number)
+    if url is None:
+        url = LAPS_BASE_URL + "&driver_number={}".format(driver_number)
+        _driver_url_cache[driver_number] = url
+    return url
+
+
+_lap_number_floor = {}  # driver number -> last lap number from its laps URL
+_floored_url_cache = {}  # driver number -> (floor, URL); rebuilt once per lap
+
+
+def floored_laps_url(driver_number):
+    """Laps URL limited server-side to laps from the last one seen onwards."""
+    floor = _lap_number_floor.get(driver_number)
+    if floor is None:
+        return api_url_for_driver(driver_number)
+    cached = _floored_url_cache.get(driver_number)
+    if cached is None or cached[0] != floor:
+        cached = (floor, api_url_for_driver(driver_number) + "&lap_number>={}".format(floor))
+        _floored_url_cache[driver_number] = cached
+    return cached[1]
+
+
+def batch_laps_url(driver_numbers):
+    global _batch_url_cache_key, _batch_url_cache
+    key = tuple(driver_numbers)
+    if key != _batch_url_cache_key:
+        _batch_url_cache = BATCH_LAPS_URL.format(",".join([str(dn) for dn in key]))
+        _batch_url_cache_key = key
+    return _batch_url_cache
 
 
 def _parse_url(url):
@@ -176,110 +324,574 @@ def _parse_url(url):
     return use_ssl, host, port, path
 
 
-async def _async_http_get(url):
-    use_ssl, host, port, path = _parse_url(url)
+HTTP_REQUEST_CACHE_LIMIT = 16
+_http_request_cache = {}  # url -> (use_ssl, host, port, request)
 
-    if use_ssl:
-        reader, writer = await uasyncio.open_connection(host, port, ssl=True)
-    else:
-        reader, writer = await uasyncio.open_connection(host, port)
 
-    request = "GET {} HTTP/1.0\r\nHost: {}\r\n\r\n".format(path, host)
-    writer.write(request.encode("utf-8"))
-    await writer.drain()
+def http_request_for(url):
+    """Return (use_ssl, host, port, encoded keep-alive GET request) for url, cached."""
+    cached = _http_request_cache.get(url)
+    if cached is None:
+        use_ssl, host, port, path = _parse_url(url)
+        request = "GET {} HTTP/1.1\r\nHost: {}\r\nConnection: keep-alive\r\n\r\n"
+        cached = (use_ssl, host, port, request.format(path, host).encode("utf-8"))
+        if len(_http_request_cache) >= HTTP_REQUEST_CACHE_LIMIT:
+            _http_request_cache.clear()
+        _http_request_cache[url] = cached
+    return cached
 
-    status_line = await reader.readline()
-    parts = status_line.decode("utf-8").split(" ", 2)
-    status_code = int(parts[1])
 
-    while True:
-        line = await reader.readline()
-        if line == b"\r\n" or line == b"\n" or line == b"":
-            break
+LAP_ETAG_CACHE_LIMIT = 8
+_lap_etags = {}  # url -> (etag, parsed result of the last 200 response)
 
-    return status_code, reader, writer
 
+def cached_lap_etag(url):
+    """Return (etag, result) stored for url, or (None, None)."""
+    return _lap_etags.get(url, (None, None))
 
-def top_drivers_from_session_payload(payload, limit=TRACKED_DRIVER_COUNT):
-    if isinstance(payload, dict):
-        entries = [payload]
-    elif isinstance(payload, list):
-        entries = payload
-    else:
-        raise RuntimeError("Bad session_result payload")
 
-    ranked = []
+def store_lap_etag(url, etag, result):
+    if etag is None:
+        _lap_etags.pop(url, None)
+        return
+    if len(_lap_etags) >= LAP_ETAG_CACHE_LIMIT and url not in _lap_etags:
+        _lap_etags.clear()
+    _lap_etags[url] = (etag, result)
+
+
+class KeepAliveResponse:
+    """Response-like view over one HTTP/1.1 body on a KeepAliveClient socket.
+
+    Exposes status_code, raw.read(n), raw.readinto(buf) and close() like
+    urequests' streamed responses. Handles Content-Length, chunked and
+    read-until-close bodies.
+    """
+
+    def __init__(self, client, status_code, content_length, chunked, keep_alive):
+        self.client = client
+        self.status_code = status_code
+        self.raw = self
+        self._remaining = content_length  # None when the length is unknown
+        self._chunked = chunked
+        self._chunk_left = 0
+        self._keep_alive = keep_alive and (chunked or content_length is not None)
+        self._done = content_length == 0
+
+    def _next_chunk_size(self):
+        sock = self.client.sock
+        line = sock.readline()
+        size = int(line.split(b";")[0].strip(), 16)
+        if size == 0:
+            while True:
+                line = sock.readline()
+                if line in (b"\r\n", b"\n", b""):
+                    break
+        return size
+
+    def _readable(self, size):
+        """Return how many body bytes may be read next; 0 at the end."""
+        if self._done:
+            return 0
+        if self._chunked:
+            if self._chunk_left == 0:
+                self._chunk_left = self._next_chunk_size()
+                if self._chunk_left == 0:
+                    self._done = True
+                    return 0
+            return min(size, self._chunk_left)
+        if self._remaining is not None:
+            return min(size, self._remaining)
+        return size
+
+    def _consumed(self, count):
+        if self._chunked:
+            if not count:
+                raise OSError("Connection closed mid-chunk")
+            self._chunk_left -= count
+            if self._chunk_left == 0:
+                self.client.sock.readline()  # CRLF after chunk data
+            return
+        if not count:
+            self._done = True
+            if self._remaining:
+                self._keep_alive = False
+            return
+        if self._remaining is not None:
+            self._remaining -= count
+            if self._remaining == 0:
+                self._done = True
+
+    def read(self, size):
+        size = self._readable(size)
+        if not size:
+            return b""
+        data = self.client.sock.read(size) or b""
+        self._consumed(len(data))
+        return data
+
+    def readinto(self, buf):
+        size = self._readable(len(buf))
+        if not size:
+            return 0
+        count = self.client.sock.readinto(memoryview(buf)[:size]) or 0
+        self._consumed(count)
+        return count
+
+    def close(self):
+        # Readers that stop early (e.g. at a JSON array's ']') usually leave
+        # only a few closing bytes; drain those so the socket stays reusable.
+        budget = KEEP_ALIVE_DRAIN_BYTES
+        while self._keep_alive and not self._done and budget > 0:
+            try:
+                data = self.read(min(budget, HTTP_READ_CHUNK_BYTES))
+            except OSError:
+                break
+            if not data:
+                break
+            budget -= len(data)
+        if not (self._done and self._keep_alive):
+            self.client.close()
 
-    for idx, entry in enumerate(entries):
-        if not isinstance(entry, dict):
-            continue
-        driver_number = entry.get("driver_number")
-        position = entry.get("position")
-        if driver_number is None or position is None:
-            continue
+
+class KeepAliveClient:
+    """Minimal HTTP/1.1 GET client that reuses one socket per origin."""
+
+    def __init__(self):
+        self.sock = None
+        self.origin = None
+
+    def close(self):
+        if self.sock is not None:
+            try:
+                self.sock.close()
+            except OSError:
+                pass
+        self.sock = None
+        self.origin = None
+
+    def _connect(self, use_ssl, host, port):
+        self.close()
+        addr = socket.getaddrinfo(host, port)[0][-1]
+        sock = socket.socket()
         try:
-            driver_number = int(driver_number)
-            position = int(position)
-        except (TypeError, ValueError):
-            continue
-        ranked.append((position, idx, driver_number))
+            sock.settimeout(HTTP_TIMEOUT_SECONDS)
+            sock.connect(addr)
+            if use_ssl:
+                import ssl
+                sock = ssl.wrap_socket(sock, server_hostname=host)
+        except Exception:
+            sock.close()
+            raise
+        self.sock = sock
+        self.origin = (use_ssl, host, port)
 
-    if not ranked:
-        raise RuntimeError("No drivers in session_result")
+    def _request(self, request):
+        self.sock.write(request)
 
-    ranked.sort()
-    top_drivers = []
-    seen = set()
-    for _position, _idx, driver_number in ranked:
-        if driver_number in seen:
-            continue
-        seen.add(driver_number)
-        top_drivers.append(driver_number)
-        if len(top_drivers) >= limit:
+        status_line = self.sock.readline()
+        if not status_line:
+            raise OSError("Connection closed")
+        status_code = int(status_line.split(None, 2)[1])
+
+        content_length = None
+        chunked = False
+        keep_alive = True
+        while True:
+            line = self.sock.readline()
+            if line in (b"\r\n", b"\n", b""):
+                break
+            parts = line.split(b":", 1)
+            if len(parts) != 2:
+                continue
+            name = parts[0].strip().lower()
+            value = parts[1].strip().lower()
+            if name == b"content-length":
+                content_length = int(value)
+            elif name == b"transfer-encoding":
+                chunked = value == b"chunked"
+            elif name == b"connection":
+                keep_alive = value != b"close"
+
+        return KeepAliveResponse(self, status_code, content_length, chunked, keep_alive)
+
+    def get(self, url):
+        use_ssl, host, port, request = http_request_for(url)
+        origin = (use_ssl, host, port)
+        reused = self.sock is not None and self.origin == origin
+        if not reused:
+            self._connect(use_ssl, host, port)
+        # Any failure leaves unread bytes on the socket, so never keep it.
+        try:
+            return self._request(request)
+        except OSError:
+            self.close()
+            if not reused:
+                raise
+        except Exception:
+            self.close()
+            raise
+        # The server may have dropped an idle keep-alive socket; retry once.
+        self._connect(use_ssl, host, port)
+        try:
+            return self._request(request)
+        except Exception:
+            self.close()
+            raise
+
+
+class AsyncKeepAliveResponse:
+    """uasyncio counterpart of KeepAliveResponse on an AsyncKeepAliveClient.
+
+    read(n) and readinto(buf) are coroutines that return b"" / 0 at the end
+    of the body. close() must be called exactly once: it hands the
+    connection to the next request, dropping it unless the body was read
+    to the end.
+    """
+
+    def __init__(self, client, status_code, content_length, chunked, keep_alive, etag):
+        self.client = client
+        self.status_code = status_code
+        self.etag = etag
+        bodiless = status_code in (204, 304) or content_length == 0
+        self._remaining = content_length  # None when the length is unknown
+        self._chunked = chunked and not bodiless
+        self._chunk_left = 0
+        self._keep_alive = keep_alive and (
+            bodiless or chunked or content_length is not None
+        )
+        self._done = bodiless
+
+    async def _io(self, awaitable):
+        # Bound every body read like KeepAliveClient's socket timeout; a
+        # timeout leaves the body unfinished, so close() drops the connection.
+        return await uasyncio.wait_for(awaitable, HTTP_TIMEOUT_SECONDS)
+
+    async def _next_chunk_size(self):
+        reader = self.client.reader
+        line = await self._io(reader.readline())
+        size = int(line.split(b";")[0].strip(), 16)
+        if size == 0:
+            while True:
+                line = await self._io(reader.readline())
+                if line in (b"\r\n", b"\n", b""):
+                    break
+        return size
+
+    async def _readable(self, size):
+        """Return how many body bytes may be read next; 0 at the end."""
+        if self._done:
+            return 0
+        if self._chunked:
+            if self._chunk_left == 0:
+                self._chunk_left = await self._next_chunk_size()
+                if self._chunk_left == 0:
+                    self._done = True
+                    return 0
+            return min(size, self._chunk_left)
+        if self._remaining is not None:
+            return min(size, self._remaining)
+        return size
+
+    async def _consumed(self, count):
+        if self._chunked:
+            if not count:
+                raise OSError("Connection closed mid-chunk")
+            self._chunk_left -= count
+            if self._chunk_left == 0:
+                await self._io(self.client.reader.readline())  # CRLF after chunk data
+            return
+        if not count:
+            self._done = True
+            if self._remaining:
+                self._keep_alive = False
+            return
+        if self._remaining is not None:
+            self._remaining -= count
+            if self._remaining == 0:
+                self._done = True
+
+    async def read(self, size):
+        size = await self._readable(size)
+        if not size:
+            return b""
+        data = await self._io(self.client.reader.read(size)) or b""
+        await self._consumed(len(data))
+        return data
+
+    async def readinto(self, buf):
+        size = await self._readable(len(buf))
+        if not size:
+            return 0
+        reader = self.client.reader
+        view = memoryview(buf)[:size]
+        # Stream.readinto only exists on newer uasyncio builds.
+        if hasattr(reader, "readinto"):
+            count = await self._io(reader.readinto(view)) or 0
+        else:
+            data = await self._io(reader.read(size)) or b""
+            count = len(data)
+            view[:count] = data
+        await self._consumed(count)
+        return count
+
+    def close(self):
+        if not (self._done and self._keep_alive):
+            self.client.close()
+        self.client.lock.release()
+
+
+class AsyncKeepAliveClient:
+    """uasyncio HTTP/1.1 GET client that reuses one connection per origin.
+
+    The lock is held from get() until the response is closed, so concurrent
+    callers queue for the open connection instead of each paying a TCP/TLS
+    handshake.
+    """
+
+    def __init__(self):
+        self.reader = None
+        self.writer = None
+        self.origin = None
+        self.lock = uasyncio.Lock()
+
+    def close(self):
+        if self.writer is not None:
+            try:
+                self.writer.close()
+            except OSError:
+                pass
+        self.reader = None
+        self.writer = None
+        self.origin = None
+
+    async def _connect(self, use_ssl, host, port):
+        self.close()
+        if use_ssl:
+            reader, writer = await uasyncio.open_connection(host, port, ssl=True)
+        else:
+            reader, writer = await uasyncio.open_connection(host, port)
+        self.reader = reader
+        self.writer = writer
+        self.origin = (use_ssl, host, port)
+
+    async def _request(self, request):
+        self.writer.write(request)
+        await self.writer.drain()
+
+        reader = self.reader
+        status_line = await reader.readline()
+        if not status_line:
+            raise OSError("Connection closed")
+        status_code = int(status_line.split(None, 2)[1])
+
+        content_length = None
+        chunked = False
+        keep_alive = True
+        etag = None
+        while True:
+            line = await reader.readline()
+            if line in (b"\r\n", b"\n", b""):
+                break
+            parts = line.split(b":", 1)
+            if len(parts) != 2:
+                continue
+            name = parts[0].strip().lower()
+            if name == b"etag":
+                etag = parts[1].strip()
+                continue
+            value = parts[1].strip().lower()
+            if name == b"content-length":
+                content_length = int(value)
+            elif name == b"transfer-encoding":
+                chunked = value == b"chunked"
+            elif name == b"connection":
+                keep_alive = value != b"close"
+
+        return AsyncKeepAliveResponse(
+            self, status_code, content_length, chunked, keep_alive, etag
+        )
+
+    async def _send(self, url, etag):
+        use_ssl, host, port, request = http_request_for(url)
+        if etag is not None:
+            request = request[:-2] + b"If-None-Match: " + etag + b"\r\n\r\n"
+        origin = (use_ssl, host, port)
+        reused = self.reader is not None and self.origin == origin
+        if not reused:
+            await self._connect(use_ssl, host, port)
+        # Bound the wait for headers like KeepAliveClient's socket timeout,
+        # so a half-open keep-alive connection cannot stall the poll loop.
+        try:
+            return await uasyncio.wait_for(self._request(request), HTTP_TIMEOUT_SECONDS)
+        except (OSError, uasyncio.TimeoutError):
+            self.close()
+            if not reused:
+                raise
+        # The server may have dropped an idle keep-alive connection; retry once.
+        await self._connect(use_ssl, host, port)
+        return await uasyncio.wait_for(self._request(request), HTTP_TIMEOUT_SECONDS)
+
+    async def get(self, url, etag=None):
+        """GET url, sending If-None-Match when etag is given.
+
+        Returns an AsyncKeepAliveResponse; the caller must close() it.
+        """
+        await self.lock.acquire()
+        try:
+            return await self._send(url, etag)
+        except BaseException:
+            self.close()
+            self.lock.release()
+            raise
+
+
+_http_client = KeepAliveClient()  # API_BASE_URL (OpenF1) requests
+_standings_client = KeepAliveClient()  # api.jolpi.ca standings requests
+_async_http_client = AsyncKeepAliveClient()  # API_BASE_URL requests from the poll loop
+
+
+def rank_top_driver(top, ranked, limit):
+    """Merge ranked (position, idx, driver_number) into top, kept sorted.
+
+    top holds at most `limit` distinct drivers, so the best drivers are
+    found without collecting and sorting every entry.
+    """
+    driver_number = ranked[2]
+    existing = None
+    for top_idx in range(len(top)):
+        if top[top_idx][2] == driver_number:
+            existing = top_idx
             break
+    if existing is not None:
+        if ranked >= top[existing]:
+            return
+        del top[existing]
+    elif len(top) >= limit and ranked >= top[-1]:
+        return
+
+    insert_at = len(top)
+    while insert_at > 0 and top[insert_at - 1] > ranked:
+        insert_at -= 1
+    top.insert(insert_at, ranked)
+    del top[limit:]
+
+
+def top_driver_numbers(top):
+    if not top:
+        raise RuntimeError("No drivers in session_result")
+    return [driver_number for _position, _idx, driver_number in top]
+
+
+def response_raw_stream(response):
+    raw_stream = getattr(response, "raw", None)
+    if raw_stream is None:
+        raise RuntimeError("No streamed response")
+    return raw_stream
+
+
+# Tail ring buffers are kept between reads instead of being reallocated per
+# response; concurrent async reads each take their own ring from the pool.
+_tail_ring_pool = []
 
-    return top_drivers[:limit]
+
+def take_tail_ring():
+    if _tail_ring_pool:
+        return _tail_ring_pool.pop()
+    return bytearray(HTTP_TAIL_BYTES)
+
+
+def give_tail_ring(ring):
+    _tail_ring_pool.append(ring)
+
+
+def ring_write(ring, write_pos, chunk):
+    """Copy chunk into the ring buffer at write_pos; return the next write_pos."""
+    size = len(ring)
+    n = len(chunk)
+    view = memoryview(chunk)
+    if n >= size:
+        ring[:] = view[n - size:]
+        return 0
+    first = min(n, size - write_pos)
+    ring[write_pos:write_pos + first] = view[:first]
+    if first < n:
+        ring[:n - first] = view[first:]
+    return (write_pos + n) % size
+
+
+def ring_contents(ring, write_pos, total):
+    """Return the ring buffer's bytes oldest-first."""
+    if total < len(ring):
+        return ring[:total]
+    return ring[write_pos:] + ring[:write_pos]
+
+
+def read_stream_tail(raw_stream, chunk_bytes=HTTP_READ_CHUNK_BYTES):
+    """Read a response to the end, keeping only its last HTTP_TAIL_BYTES."""
+    ring = take_tail_ring()
+    try:
+        write_pos = 0
+        total = 0
+        readinto = getattr(raw_stream, "readinto", None)
+        if readinto is not None:
+            # Read straight into the ring, never past its end, so no chunk
+            # objects are allocated or copied.
+            view = memoryview(ring)
+            size = len(ring)
+            while True:
+                count = readinto(view[write_pos:min(write_pos + chunk_bytes, size)])
+                if not count:
+                    break
+                total += count
+                write_pos = (write_pos + count) % size
+            return ring_contents(ring, write_pos, total)
+
+        while True:
+            chunk = raw_stream.read(chunk_bytes)
+            if not chunk:
+                break
+            if not isinstance(chunk, (bytes, bytearray)):
+                chunk = str(chunk).encode("utf-8")
+            write_pos = ring_write(ring, write_pos, chunk)
+            total += len(chunk)
+        return ring_contents(ring, write_pos, total)
+    finally:
+        give_tail_ring(ring)
 
 
 def fetch_top_session_drivers(limit=TRACKED_DRIVER_COUNT):
     response = None
-    gc.collect()
     try:
-        response = urequests.get(SESSION_RESULT_URL, stream=True)
+        response = _http_client.get(SESSION_RESULT_URL)
         if response.status_code != 200:
             raise RuntimeError("HTTP {}".format(response.status_code))
-        payload = json.loads(response.text)
-        return top_drivers_from_session_payload(payload, limit)
+        return read_top_session_drivers(response_raw_stream(response), limit)
     finally:
         if response is not None:
             response.close()
-        gc.collect()
 
 
 def fetch_event_and_session_info():
     global event_name, session_type_name, circuit_short_name, country_name, current_season_year
     response = None
-    gc.collect()
     try:
-        response = urequests.get(MEETINGS_URL, stream=True)
+        response = _http_client.get(MEETINGS_URL)
         if response.status_code != 200:
             raise RuntimeError("HTTP {}".format(response.status_code))
-        payload = json.loads(response.text)
-        current_season_year = int(payload[-1]["year"])
-        event_name = str(payload[-1]["meeting_name"])
+        # Only the newest meeting matters, so parse just the last object.
+        meeting = last_json_object(read_stream_tail(response_raw_stream(response)))
+        current_season_year = int(meeting["year"])
+        event_name = str(meeting["meeting_name"])
     finally:
         if response is not None:
             response.close()
-        gc.collect()
 
     response = None
-    gc.collect()
     try:
-        response = urequests.get(SESSIONS_URL, stream=True)
+        response = _http_client.get(SESSIONS_URL)
         if response.status_code != 200:
             raise RuntimeError("HTTP {}".format(response.status_code))
-        payload = json.loads(response.text)
-        session = payload[-1]
+        session = last_json_object(read_stream_tail(response_raw_stream(response)))
         sn = str(session["session_name"])
         session_type_name = sn
         circuit_short_name = str(session["circuit_short_name"])
@@ -287,7 +899,6 @@ def fetch_event_and_session_info():
     finally:
         if response is not None:
             response.close()
-        gc.collect()
 
 
 def ellipsize(text, max_len):
@@ -307,49 +918,54 @@ def compact_number_text(value):
 
 
 def standing_position_row(entry):
-    raw_position = entry.get("position")
-    if raw_position is not None:
-        try:
-            position = int(raw_position)
-            return position, "P{:02d}".format(position)
-        except (TypeError, ValueError):
-            pass
-
-    raw_position_text = entry.get("positionText")
-    if raw_position_text is not None:
-        try:
-            position = int(raw_position_text)
-            return position, "P{:02d}".format(position)
-        except (TypeError, ValueError):
-            pass
+    for key in STANDING_POSITION_KEYS:
+        raw_position = entry.get(key)
+        if raw_position is None:
+            continue
+        if isinstance(raw_position, int):
+            position = raw_position
+        else:
+            try:
+                position = int(raw_position)
+            except (TypeError, ValueError):
+                continue
+        if 0 <= position < len(STANDING_POSITION_TEXTS):
+            return position, STANDING_POSITION_TEXTS[position]
+        return position, "P{:02d}".format(position)
 
     return 9999, "P--"
 
 
+def standing_wins_text(wins_text):
+    text = STANDING_WINS_TEXTS.get(wins_text)
+    if text is None:
+        text = "W{}".format(wins_text)
+    return text
+
+
 def constructor_short_name_from_entry(entry):
-    raw_constructor_id = str(entry["Constructor"]["constructorId"])
-    for constructor_id, short_name in CONSTRUCTOR_SHORT_NAME_PAIRS:
-        if raw_constructor_id == constructor_id:
-            return short_name
+    # Ergast sends every Constructor/Driver field as a JSON string.
+    constructor = entry["Constructor"]
+    short_name = CONSTRUCTOR_SHORT_NAMES.get(constructor["constructorId"])
+    if short_name is not None:
+        return short_name
 
-    raw_name = str(entry["Constructor"]["name"])
-    return ellipsize(raw_name.upper(), 8)
+    return ellipsize(constructor["name"].upper(), 8)
 
 
 def driver_short_name_from_entry(entry):
     driver = entry.get("Driver", {})
     code = driver.get("code")
     if code:
-        return str(code).upper()
+        return code.upper()
 
     family_name = driver.get("familyName")
     if family_name:
-        return ellipsize(str(family_name).upper(), 3)
+        return ellipsize(family_name.upper(), 3)
 
     driver_id = driver.get("driverId")
     if driver_id:
-        compact_id = str(driver_id).replace("_", "")
-        return ellipsize(compact_id.upper(), 3)
+        return ellipsize(driver_id.replace("_", "").upper(), 3)
 
     return "---"
 
@@ -359,7 +975,7 @@ def format_driver_standing_entry(entry):
     points_text = compact_number_text(entry["points"])
     wins_text = compact_number_text(entry["wins"])
     code = driver_short_name_from_entry(entry)
-    row = (position_text, code, points_text, "W{}".format(wins_text))
+    row = (position_text, code, points_text, standing_wins_text(wins_text))
     return row, position
 
 
@@ -368,142 +984,233 @@ def format_constructor_standing_entry(entry):
     points_text = compact_number_text(entry["points"])
     wins_text = compact_number_text(entry["wins"])
     short_name = constructor_short_name_from_entry(entry)
-    row = (position_text, short_name, points_text, "W{}".format(wins_text))
+    row = (position_text, short_name, points_text, standing_wins_text(wins_text))
     return row, position
 
 
-def standings_rows_from_stream(raw_stream, entry_key, format_fn, limit=STANDINGS_ENTRY_LIMIT):
-    key_bytes = '"{}"'.format(entry_key).encode("utf-8")
-    header = bytearray()
-    key_found = False
-    array_started = False
+SCAN_IN_STRING = 0
+SCAN_ESCAPE = 1
+SCAN_DEPTH = 2
+
+
+@micropython.viper
+def scan_json_object(data: ptr8, pos: int, stop: int, state: ptr8) -> int:
+    """Walk data[pos:stop] inside a JSON object; return where the scan stopped.
+
+    Stops just past the brace that closes the object, or at stop. String,
+    escape and depth state carries across calls through state.
+    """
+    # Loads from ptr8 are uint; cast so later int assignments type-check.
+    in_string = int(state[0])
+    escape = int(state[1])
+    depth = int(state[2])
+    while pos < stop:
+        byte = int(data[pos])
+        pos += 1
+        if in_string:
+            if escape:
+                escape = 0
+            elif byte == 92:  # backslash
+                escape = 1
+            elif byte == 34:  # quote
+                in_string = 0
+        elif byte == 34:
+            in_string = 1
+        elif byte == 123:  # {
+            depth += 1
+        elif byte == 125:  # }
+            depth -= 1
+            if depth == 0:
+                break
+    state[0] = in_string
+    state[1] = escape
+    state[2] = depth
+    return pos
+
+
+class JsonEntryScanner:
+    """Copy each top-level {...} entry of a streamed JSON array into a buffer.
+
+    Feed chunks in order; on_entry(view) is called with a memoryview of each
+    complete entry, valid only until the next entry starts.
+    """
+
+    def __init__(self, on_entry, entry_bytes):
+        self.on_entry = on_entry
+        self.state = bytearray(3)  # SCAN_IN_STRING, SCAN_ESCAPE, SCAN_DEPTH
+        self.entry = bytearray(entry_bytes)
+        self.entry_len = 0
+
+    def reset(self, on_entry):
+        self.on_entry = on_entry
+        state = self.state
+        state[SCAN_IN_STRING] = 0
+        state[SCAN_ESCAPE] = 0
+        state[SCAN_DEPTH] = 0
+        self.entry_len = 0
+
+    def _append(self, view, start, stop):
+        entry_len = self.entry_len
+        end = entry_len + stop - start
+        if end > len(self.entry):
+            grown = bytearray(max(end, 2 * len(self.entry)))
+            grown[:entry_len] = memoryview(self.entry)[:entry_len]
+            self.entry = grown
+        self.entry[entry_len:end] = view[start:stop]
+        self.entry_len = end
+
+    def feed(self, data, data_len, view=None, pos=0):
+        """Scan data[pos:data_len]; return True once the array's ']' is seen."""
+        if view is None:
+            view = memoryview(data)
+        state = self.state
+        while pos < data_len:
+            if state[SCAN_DEPTH] == 0:
+                # Between entries only '{' and the closing ']' matter.
+                open_index = data.find(b"{", pos, data_len)
+                close_index = data.find(b"]", pos, data_len)
+                if close_index >= 0 and (open_index < 0 or close_index < open_index):
+                    return True
+                if open_index < 0:
+                    return False
+                self.entry_len = 0
+                state[SCAN_DEPTH] = 1
+                pos = open_index + 1
+                self._append(view, open_index, pos)
+                continue
 
-    in_string = False
-    escape = False
-    object_depth = 0
-    object_bytes = bytearray()
-
-    ranked = []
-    object_index = 0
-    def finalize_object():
-        nonlocal object_bytes, ranked, object_index
-        entry = json.loads(object_bytes.decode("utf-8"))
-        try:
-            row, position = format_fn(entry)
-        except (KeyError, TypeError, ValueError):
-            object_bytes = bytearray()
-            return
-        object_bytes = bytearray()
-        ranked.append((position, object_index, row))
-        object_index += 1
-        if limit > 0 and len(ranked) > limit:
-            ranked.sort()
-            del ranked[limit:]
+            # Inside an entry: let the viper scanner walk to the closing
+            # brace (or the end of the chunk) and copy that run in one go.
+            stop = scan_json_object(data, pos, data_len, state)
+            self._append(view, pos, stop)
+            pos = stop
+            if state[SCAN_DEPTH] == 0:
+                self.on_entry(memoryview(self.entry)[:self.entry_len])
+        return False
 
-    while True:
-        chunk = raw_stream.read(STANDINGS_READ_CHUNK_BYTES)
-        if not chunk:
-            break
-        if not isinstance(chunk, (bytes, bytearray)):
-            chunk = str(chunk).encode("utf-8")
-
-        data = chunk
-        if not array_started:
-            header.extend(data)
-            if not key_found:
-                key_index = header.find(key_bytes)
-                if key_index < 0:
-                    keep_bytes = len(key_bytes) * 2
-                    if len(header) > keep_bytes:
-                        header = header[-keep_bytes:]
-                    continue
-                key_found = True
-                header = header[key_index + len(key_bytes):]
-
-            array_index = header.find(b"[")
-            if array_index < 0:
-                if len(header) > 64:
-                    header = header[-64:]
-                continue
 
-            array_started = True
-            data = header[array_index + 1 :]
-            header = bytearray()
-
-        for byte in data:
-            if in_string:
-                if object_depth > 0:
-                    object_bytes.append(byte)
-                if escape:
-                    escape = False
-                elif byte == 92:  # backslash
-                    escape = True
-                elif byte == 34:  # quote
-                    in_string = False
-                continue
+def require_rows(rows):
+    """Return rows, raising RuntimeError when no standings entry was parsed."""
+    if not rows:
+        raise RuntimeError("No standings data")
+    return rows
 
-            if byte == 34:  # quote
-                in_string = True
-                if object_depth > 0:
-                    object_bytes.append(byte)
-                continue
 
-            if byte == 123:  # {
-                if object_depth == 0:
-                    object_bytes = bytearray()
-                object_depth += 1
-                object_bytes.append(byte)
-                continue
+def json_array_start(buf, buf_len, key):
+    """Return the index just past '<key>: [' in buf[:buf_len], or -1.
 
-            if byte == 125:  # }
-                if object_depth > 0:
-                    object_depth -= 1
-                    object_bytes.append(byte)
-                    if object_depth == 0:
-                        finalize_object()
-                continue
+    key is the quoted member name; JSON whitespace may surround the colon.
+    """
+    key_pos = buf.find(key, 0, buf_len)
+    while key_pos >= 0:
+        i = key_pos + len(key)
+        while i < buf_len and buf[i] in (32, 9, 13, 10):
+            i += 1
+        if i < buf_len and buf[i] == 58:  # colon
+            i += 1
+            while i < buf_len and buf[i] in (32, 9, 13, 10):
+                i += 1
+            if i < buf_len and buf[i] == 91:  # [
+                return i + 1
+        key_pos = buf.find(key, key_pos + 1, buf_len)
+    return -1
 
-            if object_depth > 0:
-                object_bytes.append(byte)
-                continue
 
-            if byte == 93:  # ]
-                if not ranked:
-                    raise RuntimeError("No standings data")
-                ranked.sort()
-                if limit > 0:
-                    ranked = ranked[:limit]
-                return [row for _position, _idx, row in ranked]
+def standings_rows_from_stream(raw_stream, entry_key, format_fn, limit=STANDINGS_ENTRY_LIMIT):
+    key = '"{}"'.format(entry_key).encode("utf-8")
 
-    if not ranked:
-        raise RuntimeError("No standings data")
-    ranked.sort()
-    if limit > 0:
-        ranked = ranked[:limit]
-    return [row for _position, _idx, row in ranked]
+    # Parallel lists kept in (position, arrival) order by insertion; the API
+    # already sends entries by position, so each insert is normally an append.
+    positions = []
+    rows = []
+
+    def add_entry(entry_view):
+        entry = json.loads(entry_view)
+        try:
+            row, position = format_fn(entry)
+        except (AttributeError, KeyError, TypeError, ValueError):
+            return
+        insert_at = len(positions)
+        while insert_at > 0 and positions[insert_at - 1] > position:
+            insert_at -= 1
+        if limit > 0 and insert_at >= limit:
+            return
+        if insert_at == len(positions):
+            positions.append(position)
+            rows.append(row)
+        else:
+            positions.insert(insert_at, position)
+            rows.insert(insert_at, row)
+        if limit > 0 and len(positions) > limit:
+            positions.pop()
+            rows.pop()
+
+    scanner = JsonEntryScanner(add_entry, STANDINGS_OBJECT_BYTES)
+
+    # One buffer serves both phases. While looking for the array it holds
+    # the unmatched tail of the previous reads followed by the next read;
+    # afterwards each read refills it from the start.
+    keep = STANDINGS_HEADER_KEEP_BYTES
+    buf = bytearray(keep + STANDINGS_READ_CHUNK_BYTES)
+    buf_view = memoryview(buf)
+    buf_len = 0
+    while True:
+        count = raw_stream.readinto(buf_view[buf_len:])
+        if not count:
+            return require_rows(rows)
+        buf_len += count
+        start = json_array_start(buf, buf_len, key)
+        if start >= 0:
+            break
+        if buf_len > keep:
+            # Slide the last `keep` bytes to the front in place.
+            shift = buf_len - keep
+            for i in range(keep):
+                buf[i] = buf[shift + i]
+            buf_len = keep
+
+    done = scanner.feed(buf, buf_len, buf_view, start)
+    while not done:
+        count = raw_stream.readinto(buf)
+        if not count:
+            break
+        done = scanner.feed(buf, count, buf_view)
 
+    return require_rows(rows)
 
-def aggressive_gc():
-    gc.collect()
-    gc.collect()
+
+_standings_cache = {}  # (url, limit) -> (expiry_ms, rows)
 
 
 def fetch_standing_rows(url, entry_key, format_fn, limit=STANDINGS_ENTRY_LIMIT):
+    cache_key = (url, limit)
+    cached = _standings_cache.get(cache_key)
+    if cached is not None and time.ticks_diff(cached[0], time.ticks_ms()) > 0:
+        return cached[1]
+
     response = None
-    aggressive_gc()
+    # The TLS handshake needs large contiguous blocks; collect once up front.
+    gc.collect()
     try:
-        response = urequests.get(url, headers=STANDINGS_REQUEST_HEADERS, stream=True)
+        response = _standings_client.get(url)
         if response.status_code != 200:
             raise RuntimeError("HTTP {}".format(response.status_code))
 
-        raw_stream = getattr(response, "raw", None)
-        if raw_stream is None:
-            raise RuntimeError("No streamed standings response")
-        return standings_rows_from_stream(raw_stream, entry_key, format_fn, limit)
+        rows = standings_rows_from_stream(response.raw, entry_key, format_fn, limit)
+    except Exception:
+        # Stale standings beat an error screen.
+        if cached is not None:
+            return cached[1]
+        raise
     finally:
         if response is not None:
             response.close()
-        aggressive_gc()
+
+    _standings_cache[cache_key] = (
+        time.ticks_add(time.ticks_ms(), STANDINGS_CACHE_TTL_MS),
+        rows,
+    )
+    return rows
 
 
 def fetch_driver_standing_lines():
@@ -524,7 +1231,13 @@ def fetch_constructor_standing_lines():
     )
 
 
+def invalidate_lap_screen():
+    global _lap_screen_rows
+    _lap_screen_rows = None
+
+
 def draw_lines(lines, color=WHITE):
+    invalidate_lap_screen()
     display.set_pen(BLACK)
     display.clear()
 
@@ -537,13 +1250,99 @@ def draw_lines(lines, color=WHITE):
     display.update()
 
 
-def wait_for_release(debounce_seconds=BUTTON_RELEASE_DEBOUNCE_SECONDS):
+def redraw_lines_from(first, lines, color=WHITE):
+    """Repaint draw_lines rows from index first on, keeping the rows above."""
+    y = 12 + 28 * first
+    display.set_pen(BLACK)
+    display.rectangle(0, y, WIDTH, HEIGHT - y)
+
+    display.set_pen(color)
+    for line in lines:
+        display.text(str(line), 8, y, WIDTH - 16, 2)
+        y += 28
+
+    display.update()
+
+
+def any_button_held():
+    """Return True while any of A/B/X/Y is physically held down."""
+    # One SIO register read covers all four pins; a held pin reads low.
+    return mem32[SIO_GPIO_IN] & BUTTON_PIN_MASK != BUTTON_PIN_MASK
+
+
+def pressed_button(accepted="AXYB"):
+    """Return the first accepted button whose pin reads low, or None."""
+    # Raw levels rather than Button.read(): its repeat/debounce state only
+    # advances when polled, so one read after an IRQ edge can drop a press.
+    gpio_in = mem32[SIO_GPIO_IN]
+    for name, mask in BUTTON_PINS:
+        if name in accepted and not gpio_in & mask:
+            return name
+    return None
+
+
+def wait_for_release(debounce_ms=BUTTON_RELEASE_DEBOUNCE_MS):
     """Block until all buttons are released, with a short debounce."""
-    while (BUTTON_A.read() or BUTTON_B.read() or
-           BUTTON_X.read() or BUTTON_Y.read()):
-        time.sleep(BUTTON_RELEASE_POLL_SECONDS)
-    if debounce_seconds > 0:
-        time.sleep(debounce_seconds)
+    # sleep_ms parks the core in WFE between ticks; lightsleep would also
+    # stop the clocks the CYW43 link and USB serial depend on.
+    sleep_ms = time.sleep_ms
+    while any_button_held():
+        sleep_ms(BUTTON_RELEASE_POLL_MS)
+    if debounce_ms > 0:
+        sleep_ms(debounce_ms)
+
+
+def wait_for_ui_button(accepted="AXYB"):
+    """Block until an accepted button is pressed, then released; return it."""
+    edge = _button_edge
+    sleep_ms = time.sleep_ms
+    while True:
+        # Only read the buttons once the IRQ has seen a press edge.
+        if not edge[0]:
+            sleep_ms(BUTTON_POLL_MS)
+            continue
+        edge[0] = 0
+        sleep_ms(BUTTON_PRESS_SETTLE_MS)
+        name = pressed_button(accepted)
+        if name is not None:
+            wait_for_release()
+            return name
+
+
+def draw_list_page(title, window_start, page_size, count, draw_row):
+    """Draw the title and rows window_start.. of a list; draw_row(idx, y)."""
+    display.set_pen(BLACK)
+    display.clear()
+
+    display.set_pen(WHITE)
+    display.text(title, 8, 12, WIDTH - 16, 2)
+
+    for i in range(page_size):
+        idx = window_start + i
+        if idx >= count:
+            break
+        draw_row(idx, ROW_YS[i])
+
+    display.update()
+
+
+def show_paged_list(title, count, draw_row):
+    """Page through count rows with X/Y until A is pressed."""
+    page_size = max(1, VISIBLE_ROWS)
+    window_start = 0
+
+    while True:
+        max_window_start = max(0, count - page_size)
+        if window_start > max_window_start:
+            window_start = max_window_start
+
+        draw_list_page(title, window_start, page_size, count, draw_row)
+
+        pressed = wait_for_ui_button("AXY")
+        if pressed == "A":
+            return
+        direction = -1 if pressed == "X" else 1
+        window_start = page_scroll_start(window_start, count, page_size, direction)
 
 
 def pick_from_list(title, items, format_fn):
@@ -552,6 +1351,15 @@ def pick_from_list(title, items, format_fn):
     count = len(items)
     window_start = 0
 
+    def draw_row(idx, y):
+        label = format_fn(items[idx])
+        if idx == cursor:
+            display.set_pen(CYAN)
+            display.text("> {}".format(label), 8, y, WIDTH - 16, 2)
+        else:
+            display.set_pen(WHITE)
+            display.text("  {}".format(label), 8, y, WIDTH - 16, 2)
+
     while True:
         # Keep cursor visible within the window
         if cursor < window_start:
@@ -559,66 +1367,27 @@ def pick_from_list(title, items, format_fn):
         if cursor >= window_start + VISIBLE_ROWS:
             window_start = cursor - VISIBLE_ROWS + 1
 
-        display.set_pen(BLACK)
-        display.clear()
+        draw_list_page(title, window_start, VISIBLE_ROWS, count, draw_row)
 
-        # Title
-        display.set_pen(WHITE)
-        display.text(title, 8, 12, WIDTH - 16, 2)
-
-        # List items
-        for i in range(VISIBLE_ROWS):
-            idx = window_start + i
-            if idx >= count:
-                break
-            label = format_fn(items[idx])
-            y = 12 + (i + 1) * ROW_HEIGHT
-            if idx == cursor:
-                display.set_pen(CYAN)
-                display.text("> {}".format(label), 8, y, WIDTH - 16, 2)
-            else:
-                display.set_pen(WHITE)
-                display.text("  {}".format(label), 8, y, WIDTH - 16, 2)
-
-        display.update()
-
-        # Wait for a button press
-        while True:
-            if BUTTON_A.read():
-                wait_for_release()
-                return None
-            if BUTTON_X.read():
-                cursor = (cursor - 1) % count
-                wait_for_release()
-                break
-            if BUTTON_Y.read():
-                cursor = (cursor + 1) % count
-                wait_for_release()
-                break
-            if BUTTON_B.read():
-                wait_for_release()
-                return cursor
-            time.sleep(BUTTON_POLL_SECONDS)
+        pressed = wait_for_ui_button()
+        if pressed == "A":
+            return None
+        if pressed == "B":
+            return cursor
+        if pressed == "X":
+            cursor = (cursor - 1) % count
+        else:
+            cursor = (cursor + 1) % count
 
 
 def select_driver_interactive():
     """Two-step interactive driver selection; A cancels back to main screen."""
-    all_numbers = sorted(DRIVER_CODES.keys())
-
-    new_idx = pick_from_list(
-        "Pick driver",
-        all_numbers,
-        lambda n: "{} #{}".format(DRIVER_CODES[n], n),
-    )
+    new_idx = pick_from_list("Pick driver", DRIVER_PICK_NUMBERS, driver_pick_label)
     if new_idx is None:
         return False
-    new_driver = all_numbers[new_idx]
+    new_driver = DRIVER_PICK_NUMBERS[new_idx]
 
-    slot_idx = pick_from_list(
-        "Replace who?",
-        TRACKED_DRIVERS,
-        lambda n: "{} #{}".format(format_driver_code(n), n),
-    )
+    slot_idx = pick_from_list("Replace who?", TRACKED_DRIVERS, driver_pick_label)
     if slot_idx is None:
         return False
     TRACKED_DRIVERS[slot_idx] = new_driver
@@ -651,46 +1420,13 @@ def page_scroll_start(current_start, count, page_size, direction):
 
 
 def show_scrollable_lines(title, lines):
-    display.set_font("bitmap8")
-
-    count = len(lines)
-    page_size = max(1, VISIBLE_ROWS)
-    window_start = 0
-
-    while True:
-        max_window_start = max(0, count - page_size)
-        if window_start > max_window_start:
-            window_start = max_window_start
-
-        display.set_pen(BLACK)
-        display.clear()
+    set_display_font("bitmap8")
 
+    def draw_row(idx, y):
         display.set_pen(WHITE)
-        display.text(title, 8, 12, WIDTH - 16, 2)
-
-        for i in range(page_size):
-            idx = window_start + i
-            if idx >= count:
-                break
-            y = 12 + (i + 1) * ROW_HEIGHT
-            display.set_pen(WHITE)
-            display.text("  {}".format(lines[idx]), 8, y, WIDTH - 16, 2)
+        display.text("  {}".format(lines[idx]), 8, y, WIDTH - 16, 2)
 
-        display.update()
-
-        while True:
-            if BUTTON_A.read():
-                wait_for_release()
-                return
-            if BUTTON_X.read():
-                window_start = page_scroll_start(window_start, count, page_size, -1)
-                wait_for_release()
-                break
-            if BUTTON_Y.read():
-                window_start = page_scroll_start(window_start, count, page_size, 1)
-                wait_for_release()
-                break
-            time.sleep(BUTTON_POLL_SECONDS)
+    show_paged_list(title, len(lines), draw_row)
 
 
 def fit_text_to_width(text, max_width, scale=2):
@@ -706,17 +1442,34 @@ def fit_text_to_width(text, max_width, scale=2):
     if ellipsis_width >= max_width:
         return ""
 
-    while value and text_pixel_width(value + ellipsis, scale) > max_width:
-        value = value[:-1]
-    return value + ellipsis
+    # Binary-search the longest prefix that fits with the ellipsis; trial
+    # prefixes are one-offs, so measure them without caching.
+    lo = 0  # the bare ellipsis fits, checked above
+    hi = len(value)
+    while lo < hi:
+        mid = (lo + hi + 1) // 2
+        if display.measure_text(value[:mid] + ellipsis, scale) <= max_width:
+            lo = mid
+        else:
+            hi = mid - 1
+    return value[:lo] + ellipsis
+
 
+STANDINGS_LAYOUT_CACHE_LIMIT = 4
+_standings_layouts = {}  # id(rows) -> (rows, name_points_gap, layout)
 
-def show_scrollable_standings_rows(title, rows, name_points_gap=STANDINGS_NAME_POINTS_GAP):
-    display.set_font("bitmap8")
 
-    count = len(rows)
-    page_size = max(1, VISIBLE_ROWS)
-    window_start = 0
+def standings_layout(rows, name_points_gap):
+    """Measure standings columns and fit names once per rows list.
+
+    Returns (pos_x, name_x, points_x, wins_x, pos_col_width, name_width,
+    points_col_width, wins_col_width, fitted_rows). fetch_standing_rows
+    returns the same cached list until its TTL expires, so reopening a
+    standings screen reuses the layout without measuring any text.
+    """
+    cached = _standings_layouts.get(id(rows))
+    if cached is not None and cached[0] is rows and cached[1] == name_points_gap:
+        return cached[2]
 
     left_margin = 8
     right_margin = 8
@@ -748,62 +1501,53 @@ def show_scrollable_standings_rows(title, rows, name_points_gap=STANDINGS_NAME_P
         points_x = name_x + name_col_width + col_gap
         wins_x = points_x + points_col_width + col_gap
 
-    while True:
-        max_window_start = max(0, count - page_size)
-        if window_start > max_window_start:
-            window_start = max_window_start
+    name_width = max(1, points_x - name_x - col_gap)
+    fitted_rows = [
+        (pos_text, fit_text_to_width(name_text, name_width, 2), points_text, wins_text)
+        for pos_text, name_text, points_text, wins_text in rows
+    ]
 
-        display.set_pen(BLACK)
-        display.clear()
+    layout = (
+        pos_x, name_x, points_x, wins_x,
+        pos_col_width, name_width, points_col_width, wins_col_width,
+        fitted_rows,
+    )
+    if len(_standings_layouts) >= STANDINGS_LAYOUT_CACHE_LIMIT:
+        _standings_layouts.clear()
+    _standings_layouts[id(rows)] = (rows, name_points_gap, layout)
+    return layout
 
-        display.set_pen(WHITE)
-        display.text(title, 8, 12, WIDTH - 16, 2)
 
-        for i in range(page_size):
-            idx = window_start + i
-            if idx >= count:
-                break
+def show_scrollable_standings_rows(title, rows, name_points_gap=STANDINGS_NAME_POINTS_GAP):
+    set_display_font("bitmap8")
+    (
+        pos_x, name_x, points_x, wins_x,
+        pos_col_width, name_width, points_col_width, wins_col_width,
+        fitted_rows,
+    ) = standings_layout(rows, name_points_gap)
 
-            y = 12 + (i + 1) * ROW_HEIGHT
-            pos_text, name_text, points_text, wins_text = rows[idx]
-            name_draw = fit_text_to_width(name_text, max(1, points_x - name_x - col_gap), 2)
+    def draw_row(idx, y):
+        pos_text, name_draw, points_text, wins_text = fitted_rows[idx]
 
-            display.set_pen(WHITE)
+        display.set_pen(WHITE)
 
-            display.text(pos_text, pos_x, y, pos_col_width, 2)
-            display.text(name_draw, name_x, y, max(1, points_x - name_x - col_gap), 2)
-            display.text(points_text, points_x, y, points_col_width, 2)
-            display.text(wins_text, wins_x, y, wins_col_width, 2)
+        display.text(pos_text, pos_x, y, pos_col_width, 2)
+        display.text(name_draw, name_x, y, name_width, 2)
+        display.text(points_text, points_x, y, points_col_width, 2)
+        display.text(wins_text, wins_x, y, wins_col_width, 2)
 
-        display.update()
-
-        while True:
-            if BUTTON_A.read():
-                wait_for_release()
-                return
-            if BUTTON_X.read():
-                window_start = page_scroll_start(window_start, count, page_size, -1)
-                wait_for_release()
-                break
-            if BUTTON_Y.read():
-                window_start = page_scroll_start(window_start, count, page_size, 1)
-                wait_for_release()
-                break
-            time.sleep(BUTTON_POLL_SECONDS)
+    show_paged_list(title, len(fitted_rows), draw_row)
 
 
 def show_standings_screen(title, fetch_lines_fn, name_points_gap=STANDINGS_NAME_POINTS_GAP):
     draw_lines([title, "Loading..."], CYAN)
-    gc.collect()
     try:
         rows_or_lines = fetch_lines_fn()
     except RuntimeError as exc:
-        gc.collect()
         if str(exc) != "No standings data":
             raise
         show_scrollable_lines(title, [NO_STANDINGS_MESSAGE])
         return
-    gc.collect()
 
     if not rows_or_lines:
         show_scrollable_lines(title, [NO_STANDINGS_MESSAGE])
@@ -812,13 +1556,18 @@ def show_standings_screen(title, fetch_lines_fn, name_points_gap=STANDINGS_NAME_
     show_scrollable_standings_rows(title, rows_or_lines, name_points_gap)
 
 
-def empty_lap_results():
-    results = {}
-    for dn in TRACKED_DRIVERS:
+def reset_lap_results(results, driver_numbers):
+    """Clear results in place and map each driver to (None, None)."""
+    results.clear()
+    for dn in driver_numbers:
         results[dn] = (None, None)
     return results
 
 
+def empty_lap_results():
+    return reset_lap_results({}, TRACKED_DRIVERS)
+
+
 def has_lap_data(lap_results):
     for dn in TRACKED_DRIVERS:
         lap_result = lap_results.get(dn)
@@ -829,16 +1578,39 @@ def has_lap_data(lap_results):
     return False
 
 
+LAP_FINGERPRINT_MASK = 0x3FFFFFFF  # stays a small int on 32-bit ports
+
+
+def lap_results_fingerprint(lap_results):
+    """Fold the tracked drivers' lap results into one int for change checks."""
+    fp = 0
+    for dn in TRACKED_DRIVERS:
+        lap_result = lap_results.get(dn) or (None, None)
+        for value in (dn, lap_result[0], lap_result[1]):
+            if value is None:
+                value = LAP_FINGERPRINT_MASK
+            # Rotate left by 5 within 30 bits, then mix in the next value.
+            fp = ((fp & 0x1FFFFFF) << 5) ^ (fp >> 25) ^ (value & LAP_FINGERPRINT_MASK)
+    return fp
+
+
 def build_lap_rows(lap_results):
+    """Format lap rows, reusing the previous rows when the inputs match."""
+    global _lap_rows_cache_key, _lap_rows_cache
+    drivers = tuple(TRACKED_DRIVERS)
+    lap_values = tuple([lap_results.get(dn) for dn in drivers])
+    cache_key = (drivers, lap_values)
+    if cache_key == _lap_rows_cache_key:
+        return _lap_rows_cache
+
+    # Each driver's result was looked up once for the key; reuse it below.
     rows = []
     leader_duration = None
-    if TRACKED_DRIVERS:
-        leader_result = lap_results.get(TRACKED_DRIVERS[0])
-        if leader_result is not None and leader_result[0] is not None:
-            leader_duration = float(leader_result[0])
+    if lap_values and lap_values[0] is not None:
+        leader_duration = lap_values[0][0]
 
-    for dn in TRACKED_DRIVERS:
-        lap_result = lap_results.get(dn)
+    for idx in range(len(drivers)):
+        lap_result = lap_values[idx]
         if lap_result is None:
             duration = None
             lap_number = None
@@ -859,40 +1631,38 @@ def build_lap_rows(lap_results):
             lap_text = "lap --"
         else:
             lap_text = format_lap_number(lap_number)
-        rows.append((format_driver_code(dn), duration_text, gap_text, lap_text))
+        rows.append((format_driver_code(drivers[idx]), duration_text, gap_text, lap_text))
+
+    _lap_rows_cache_key = cache_key
+    _lap_rows_cache = rows
     return rows
 
 
 def text_pixel_width(text, scale=2):
-    return display.measure_text(str(text), scale)
-
-
-def draw_lap_screen(lap_results, color=WHITE):
-    rows = build_lap_rows(lap_results)
-    # Measure and render lap rows using a fixed font so column spacing
-    # does not depend on whatever screen was shown previously.
-    display.set_font("bitmap8")
+    text = str(text)
+    key = (_display_font, scale, text)
+    width = _text_width_cache.get(key)
+    if width is None:
+        if len(_text_width_cache) >= TEXT_WIDTH_CACHE_LIMIT:
+            _text_width_cache.clear()
+        width = display.measure_text(text, scale)
+        _text_width_cache[key] = width
+    return width
+
+
+def lap_screen_layout(driver_col_width, gap_col_width):
+    layout_key = (driver_col_width, gap_col_width)
+    layout = _lap_layout_cache.get(layout_key)
+    if layout is not None:
+        return layout
 
     left_margin = 8
     right_margin = 8
     driver_gap = MAIN_SCREEN_DRIVER_GAP
     gap_gap = 6
     lap_gap = 6
-
-    driver_col_width = text_pixel_width("WWW", 2)
-    for driver_code, _duration_text, _gap_text, _lap_text in rows:
-        code_width = text_pixel_width(driver_code, 2)
-        if code_width > driver_col_width:
-            driver_col_width = code_width
-
-    duration_col_width = text_pixel_width("88:88.888", 2)
-    gap_col_width = text_pixel_width("+88.888", 2)
-    for _driver_code, _duration_text, gap_text, _lap_text in rows:
-        gap_width = text_pixel_width(gap_text, 2)
-        if gap_width > gap_col_width:
-            gap_col_width = gap_width
-
-    lap_col_width = text_pixel_width("lap 88", 2)
+    duration_col_width = LAP_DURATION_COL_WIDTH
+    lap_col_width = LAP_LAP_COL_WIDTH
 
     duration_x = left_margin + driver_col_width + driver_gap
     gap_x = duration_x + duration_col_width + gap_gap
@@ -911,45 +1681,149 @@ def draw_lap_screen(lap_results, color=WHITE):
         gap_x = duration_x + duration_col_width + gap_gap
         lap_x = gap_x + gap_col_width + lap_gap
 
-    driver_wrap = max(1, duration_x - left_margin - driver_gap)
-    duration_wrap = max(1, gap_x - duration_x - gap_gap)
-    gap_wrap = max(1, lap_x - gap_x - lap_gap)
-    lap_wrap = max(1, WIDTH - lap_x - right_margin)
+    layout = (
+        duration_x,
+        gap_x,
+        lap_x,
+        max(1, duration_x - left_margin - driver_gap),
+        max(1, gap_x - duration_x - gap_gap),
+        max(1, lap_x - gap_x - lap_gap),
+        max(1, WIDTH - lap_x - right_margin),
+    )
+    _lap_layout_cache[layout_key] = layout
+    return layout
+
+
+def draw_lap_screen(lap_results, color=WHITE):
+    global _lap_screen_key, _lap_info_key, _lap_screen_rows
+    rows = build_lap_rows(lap_results)
+    info_key = (show_event_info, event_info_snapshot())
+    # build_lap_rows hands back the same list for unchanged inputs, so an
+    # identical frame can be skipped before measuring or drawing anything.
+    if (rows is _lap_screen_rows and info_key == _lap_info_key
+            and _lap_screen_key is not None and _lap_screen_key[0] == color):
+        return
+    # Measure and render lap rows using a fixed font so column spacing
+    # does not depend on whatever screen was shown previously.
+    set_display_font("bitmap8")
+
+    left_margin = 8
+
+    driver_col_width = LAP_DRIVER_COL_WIDTH
+    for dn in TRACKED_DRIVERS:
+        if 0 <= dn < len(DRIVER_CODE_WIDTH_TABLE):
+            code_width = DRIVER_CODE_WIDTH_TABLE[dn]
+        else:
+            code_width = text_pixel_width(format_driver_code(dn), 2)
+        if code_width > driver_col_width:
+            driver_col_width = code_width
+
+    # Gaps no longer than the reference string fit its column already.
+    gap_col_width = LAP_GAP_COL_WIDTH
+    for _driver_code, _duration_text, gap_text, _lap_text in rows:
+        if len(gap_text) <= LAP_GAP_REFERENCE_LEN:
+            continue
+        gap_width = text_pixel_width(gap_text, 2)
+        if gap_width > gap_col_width:
+            gap_col_width = gap_width
+
+    layout = lap_screen_layout(driver_col_width, gap_col_width)
+    screen_key = (color, layout, len(rows))
+    info_y = ROW_YS[len(rows)] + 16
+    if screen_key == _lap_screen_key and _lap_screen_rows is not None:
+        changed = redraw_changed_lap_rows(rows, color, layout)
+        if info_key != _lap_info_key:
+            display.set_pen(BLACK)
+            display.rectangle(0, info_y, WIDTH, HEIGHT - info_y)
+            draw_event_info(info_y)
+            _lap_info_key = info_key
+            changed = True
+        if changed:
+            display.update()
+        return
 
     display.set_pen(BLACK)
     display.clear()
     display.set_pen(color)
     display.text("Latest lap times", left_margin, 12, WIDTH - 16, 2)
 
-    y = 12 + ROW_HEIGHT
-    for driver_code, duration_text, gap_text, lap_text in rows:
-        display.text(driver_code, left_margin, y, driver_wrap, 2)
-        display.text(duration_text, duration_x, y, duration_wrap, 2)
-        display.text(gap_text, gap_x, y, gap_wrap, 2)
-        display.text(lap_text, lap_x, y, lap_wrap, 2)
-        y += ROW_HEIGHT
+    for idx, row in enumerate(rows):
+        draw_lap_row(row, ROW_YS[idx], layout)
 
-    if show_event_info:
-        info_y = y + 16
-        info_scale = 2
-        info_row_height = 18
-        display.set_font("bitmap6")
-        display.set_pen(CYAN)
-        for info_text in (event_name, session_type_name, circuit_short_name, country_name):
+    draw_event_info(info_y)
+
+    display.update()
+    _lap_screen_key = screen_key
+    _lap_info_key = info_key
+    _lap_screen_rows = rows
+
+
+EVENT_INFO_SCALE = 2
+EVENT_INFO_ROW_HEIGHT = 18
+_event_info_layout_key = None
+_event_info_layout = ()  # (text, x, y offset) per non-empty info line
+
+
+def event_info_layout():
+    """Centre the event info lines, re-measuring only when the info changes."""
+    global _event_info_layout_key, _event_info_layout
+    snapshot = event_info_snapshot()
+    if snapshot != _event_info_layout_key:
+        layout = []
+        dy = 0
+        for info_text in snapshot:
             if info_text:
-                tw = text_pixel_width(info_text, info_scale)
+                tw = text_pixel_width(info_text, EVENT_INFO_SCALE)
                 info_x = (WIDTH - tw) // 2
                 if info_x < 0:
                     info_x = 0
-                display.text(info_text, info_x, info_y, WIDTH - info_x, info_scale)
-                info_y += info_row_height
+                layout.append((info_text, info_x, dy))
+                dy += EVENT_INFO_ROW_HEIGHT
+        _event_info_layout = tuple(layout)
+        _event_info_layout_key = snapshot
+    return _event_info_layout
 
-    display.set_font("bitmap8")
 
-    display.update()
+def draw_event_info(info_y):
+    if show_event_info:
+        set_display_font("bitmap6")
+        display.set_pen(CYAN)
+        for info_text, info_x, dy in event_info_layout():
+            display.text(info_text, info_x, info_y + dy, WIDTH - info_x, EVENT_INFO_SCALE)
+
+    set_display_font("bitmap8")
+
+
+def draw_lap_row(row, y, layout):
+    driver_code, duration_text, gap_text, lap_text = row
+    duration_x, gap_x, lap_x, driver_wrap, duration_wrap, gap_wrap, lap_wrap = layout
+    text = display.text
+    text(driver_code, 8, y, driver_wrap, 2)
+    text(duration_text, duration_x, y, duration_wrap, 2)
+    text(gap_text, gap_x, y, gap_wrap, 2)
+    text(lap_text, lap_x, y, lap_wrap, 2)
+
+
+def redraw_changed_lap_rows(rows, color, layout):
+    """Repaint rows that differ from the frame on screen; True if any did."""
+    global _lap_screen_rows
+    changed = False
+    for idx, row in enumerate(rows):
+        if row != _lap_screen_rows[idx]:
+            changed = True
+            y = ROW_YS[idx]
+            display.set_pen(BLACK)
+            display.rectangle(0, y, WIDTH, ROW_HEIGHT)
+            display.set_pen(color)
+            draw_lap_row(row, y, layout)
+
+    _lap_screen_rows = rows
+    return changed
 
 
 def draw_cached_main_screen(lap_results):
+    # Sub-screens have drawn over the whole display.
+    invalidate_lap_screen()
     draw_lap_screen(lap_results, GREEN)
 
 
@@ -966,7 +1840,6 @@ def _handle_pending_button(last_lap_results):
 
     try:
         if pressed == 'X':
-            aggressive_gc()
             if current_season_year is None:
                 try:
                     fetch_event_and_session_info()
@@ -980,7 +1853,6 @@ def _handle_pending_button(last_lap_results):
             return True, last_lap_results
 
         if pressed == 'Y':
-            aggressive_gc()
             if current_season_year is None:
                 try:
                     fetch_event_and_session_info()
@@ -997,20 +1869,15 @@ def _handle_pending_button(last_lap_results):
         if pressed == 'A':
             selection_changed = select_driver_interactive()
             if selection_changed:
-                refreshed_results = {}
-                for dn in TRACKED_DRIVERS:
-                    try:
-                        lap_duration, lap_number, _ = fetch_latest_lap_duration(dn)
-                        refreshed_results[dn] = (lap_duration, lap_number)
-                    except Exception:
-                        refreshed_results[dn] = (None, None)
-                last_lap_results = refreshed_results
+                last_lap_results = fetch_lap_results(TRACKED_DRIVERS)
             draw_cached_main_screen(last_lap_results)
             return True, last_lap_results
 
         if pressed == 'B':
             show_event_info = not show_event_info
-            draw_cached_main_screen(last_lap_results)
+            # Nothing else drew over the main screen, so only the event
+            # info block needs repainting.
+            draw_lap_screen(last_lap_results, GREEN)
             return True, last_lap_results
     finally:
         _polling_buttons = True
@@ -1021,19 +1888,36 @@ def _handle_pending_button(last_lap_results):
 async def _check_buttons_task():
     global _button_pressed
     while True:
+        await _button_irq_flag.wait()
+        if not _polling_buttons or _button_pressed is not None:
+            continue
+        # Let contact bounce settle; a release bounce then reads high.
+        await uasyncio.sleep_ms(BUTTON_PRESS_SETTLE_MS)
         if _polling_buttons and _button_pressed is None:
-            if BUTTON_A.read():
-                _button_pressed = 'A'
-            elif BUTTON_B.read():
-                _button_pressed = 'B'
-            elif BUTTON_X.read():
-                _button_pressed = 'X'
-            elif BUTTON_Y.read():
-                _button_pressed = 'Y'
-        await uasyncio.sleep_ms(20)
-
-
-def connect_wifi(ssid, password, timeout_seconds=20):
+            _button_pressed = pressed_button()
+            if _button_pressed is not None:
+                _button_event.set()
+
+
+def wifi_status_reason(status):
+    reason = WIFI_STATUS_MAP.get(status)
+    if reason is None:
+        reason = "status {}".format(status)
+    return reason
+
+
+def _fail_connect(wlan, message):
+    wlan.disconnect()
+    raise RuntimeError(message)
+
+
+def connect_wifi(ssid, password, timeout_seconds=20, cancel_on_button=False):
+    """Connect the station interface, drawing progress; return the WLAN.
+
+    With cancel_on_button, a button press aborts the attempt: it is stored in
+    _button_pressed and RuntimeError is raised so the caller can handle it.
+    """
+    global _button_pressed
     if WIFI_COUNTRY:
         import rp2
         rp2.country(WIFI_COUNTRY)
@@ -1042,16 +1926,6 @@ def connect_wifi(ssid, password, timeout_seconds=20):
     wlan.active(True)
     wlan.config(pm=0xA11140)  # Disable power save to avoid flaky station links.
 
-    status_map = {
-        -3: "Wrong password",
-        -2: "AP not found",
-        -1: "Connect failed",
-        0: "Idle",
-        1: "Connecting",
-        2: "No IP yet",
-        3: "Connected",
-    }
-
     if wlan.isconnected():
         ip = wlan.ifconfig()[0]
         draw_lines(["Wi-Fi", "Already connected", ip], GREEN)
@@ -1063,210 +1937,599 @@ def connect_wifi(ssid, password, timeout_seconds=20):
     wlan.connect(ssid, password)
 
     start = time.ticks_ms()
+    deadline = time.ticks_add(start, timeout_seconds * 1000)
     shown_second = -1
     negative_status = None
     negative_since_ms = None
     negative_status_grace_ms = 2000
     while not wlan.isconnected():
         status = wlan.status()
+        now_ms = time.ticks_ms()
         if status < 0:
-            now_ms = time.ticks_ms()
             if status != negative_status:
                 negative_status = status
                 negative_since_ms = now_ms
             elif negative_since_ms is not None:
                 if time.ticks_diff(now_ms, negative_since_ms) >= negative_status_grace_ms:
-                    reason = status_map.get(status, "status {}".format(status))
-                    wlan.disconnect()
-                    raise RuntimeError("Wi-Fi {}".format(reason))
+                    _fail_connect(wlan, "Wi-Fi {}".format(wifi_status_reason(status)))
         else:
             negative_status = None
             negative_since_ms = None
 
-        elapsed = time.ticks_diff(time.ticks_ms(), start) // 1000
+        elapsed = time.ticks_diff(now_ms, start) // 1000
         if elapsed != shown_second:
+            status_lines = ["Connecting {}s".format(elapsed), "st {}".format(status)]
+            if shown_second < 0:
+                draw_lines(["Wi-Fi"] + status_lines, CYAN)
+            else:
+                # Only the counter and status change; keep the title row.
+                redraw_lines_from(1, status_lines, CYAN)
             shown_second = elapsed
-            draw_lines(
-                ["Wi-Fi", "Connecting {}s".format(elapsed), "st {}".format(status)],
-                CYAN,
-            )
 
-        if time.ticks_diff(time.ticks_ms(), start) > timeout_seconds * 1000:
-            reason = status_map.get(wlan.status(), "status {}".format(wlan.status()))
-            wlan.disconnect()
-            raise RuntimeError("Timeout ({})".format(reason))
+        remaining_ms = time.ticks_diff(deadline, time.ticks_ms())
+        if remaining_ms < 0:
+            _fail_connect(wlan, "Timeout ({})".format(wifi_status_reason(wlan.status())))
+
+        if cancel_on_button and _button_edge[0]:
+            _button_edge[0] = 0
+            name = pressed_button()
+            if name is not None:
+                _button_pressed = name
+                _fail_connect(wlan, "Wi-Fi cancelled")
 
-        time.sleep(0.25)
+        # Never sleep past the deadline; the next pass reports the timeout.
+        time.sleep_ms(min(WIFI_POLL_MS, remaining_ms + 1))
 
     draw_lines(["Wi-Fi connected", wlan.ifconfig()[0]], GREEN)
     time.sleep(1)
     return wlan
 
 
-def lap_from_tail_json(tail_text):
-    end = len(tail_text)
+def last_json_object_span(buf, end):
+    """Return (start, stop) of the last complete top-level {...} before end.
+
+    Walks the raw bytes backwards once, tracking brace depth outside of
+    strings. Returns None when no complete object is found.
+    """
+    depth = 0
+    stop = -1
+    in_string = False
+    i = end - 1
+    while i >= 0:
+        byte = buf[i]
+        if byte == 34:  # quote
+            backslashes = 0
+            j = i - 1
+            while j >= 0 and buf[j] == 92:  # backslash
+                backslashes += 1
+                j -= 1
+            if backslashes % 2 == 0:
+                in_string = not in_string
+        elif not in_string:
+            if byte == 125:  # }
+                if depth == 0:
+                    stop = i + 1
+                depth += 1
+            elif byte == 123 and depth > 0:  # {
+                depth -= 1
+                if depth == 0:
+                    return i, stop
+        i -= 1
+    return None
+
+
+def last_json_object(buf):
+    span = last_json_object_span(buf, len(buf))
+    if span is None:
+        raise RuntimeError("No JSON object")
+    start, stop = span
+    return json.loads(memoryview(buf)[start:stop])
+
+
+def lap_field_span(entry, entry_len, key):
+    """Return (start, stop) of key's numeric value in entry, or None if null/absent."""
+    start = entry.find(key, 0, entry_len)
+    if start < 0:
+        return None
+    start += len(key)
+    while start < entry_len and entry[start] in (32, 58):  # space, colon
+        start += 1
+    stop = start
+    while stop < entry_len and (48 <= entry[stop] <= 57 or entry[stop] in (45, 46)):  # 0-9 - .
+        stop += 1
+    if stop == start or stop - start > LAP_FIELD_BYTES:
+        return None
+    return start, stop
+
+
+def lap_field_text(entry_view, span):
+    start, stop = span
+    return bytes(entry_view[start:stop]).decode()
+
+
+class LatestLapTracker:
+    """Forward-scan a laps array, keeping only the newest completed lap.
+
+    Entries pass through one JsonEntryScanner buffer; for each entry whose
+    lap_duration is not null only the lap_duration and lap_number literals
+    are copied out, so no lap JSON outlives its own scan.
+    """
+
+    def __init__(self):
+        self.scanner = JsonEntryScanner(self.add_entry, LAP_OBJECT_BYTES)
+        self.duration = bytearray(LAP_FIELD_BYTES)
+        self.duration_len = 0
+        self.number = bytearray(LAP_FIELD_BYTES)
+        self.number_len = 0  # 0 when the newest lap's lap_number is null
+        self.chunk = bytearray(HTTP_READ_CHUNK_BYTES)  # readinto target
+        self.chunk_view = memoryview(self.chunk)
+
+    def reset(self):
+        self.scanner.reset(self.add_entry)
+        self.duration_len = 0
+        self.number_len = 0
+
+    def add_entry(self, entry_view):
+        entry = self.scanner.entry
+        entry_len = len(entry_view)
+        span = lap_field_span(entry, entry_len, LAP_DURATION_KEY)
+        if span is None:
+            return
+        start, stop = span
+        self.duration[:stop - start] = entry_view[start:stop]
+        self.duration_len = stop - start
+        span = lap_field_span(entry, entry_len, LAP_NUMBER_KEY)
+        if span is None:
+            self.number_len = 0
+            return
+        start, stop = span
+        self.number[:stop - start] = entry_view[start:stop]
+        self.number_len = stop - start
+
+    def feed(self, data, data_len, view=None):
+        self.scanner.feed(data, data_len, view)
+
+    def latest(self):
+        """Return (lap_duration ms, lap_number) of the newest completed lap."""
+        if not self.duration_len:
+            raise RuntimeError("No lap_duration rows")
+        lap_duration = to_millis(bytes(self.duration[:self.duration_len]).decode())
+        if not self.number_len:
+            return lap_duration, None
+        return lap_duration, int(bytes(self.number[:self.number_len]).decode())
+
+
+_lap_tracker_pool = []
+
+
+def take_lap_tracker():
+    if _lap_tracker_pool:
+        tracker = _lap_tracker_pool.pop()
+        tracker.reset()
+        return tracker
+    return LatestLapTracker()
+
+
+def give_lap_tracker(tracker):
+    _lap_tracker_pool.append(tracker)
+
+
+def feed_lap_tracker(raw_stream, tracker):
+    """Drain a raw response stream into tracker.feed()."""
+    readinto = getattr(raw_stream, "readinto", None)
     while True:
-        end = tail_text.rfind("}", 0, end)
-        if end < 0:
-            break
-        start = tail_text.rfind("{", 0, end)
-        if start < 0:
+        if readinto is not None:
+            count = readinto(tracker.chunk)
+            if not count:
+                break
+            tracker.feed(tracker.chunk, count, tracker.chunk_view)
+            continue
+        chunk = raw_stream.read(HTTP_READ_CHUNK_BYTES)
+        if not chunk:
             break
-        candidate = json.loads(tail_text[start : end + 1])
-        lap_duration = candidate["lap_duration"]
-        if lap_duration is not None:
-            lap_number = candidate["lap_number"]
-            driver_number = candidate["driver_number"]
-            return lap_duration, lap_number, driver_number
-        end = start
+        tracker.feed(chunk, len(chunk))
+
+
+def read_latest_lap(raw_stream):
+    """Drain a laps response and return its newest (duration ms, lap_number)."""
+    tracker = take_lap_tracker()
+    try:
+        feed_lap_tracker(raw_stream, tracker)
+        return tracker.latest()
+    finally:
+        give_lap_tracker(tracker)
+
+
+def read_top_session_drivers(raw_stream, limit=TRACKED_DRIVER_COUNT):
+    """Stream a session_result response; return its best `limit` drivers.
+
+    Only each entry's driver_number and position literals are decoded, via a
+    pooled LatestLapTracker's scanner, instead of parsing the whole body.
+    """
+    top = []
+    tracker = take_lap_tracker()
+    scanner = tracker.scanner
+    next_idx = [0]
+
+    def add_entry(entry_view):
+        idx = next_idx[0]
+        next_idx[0] = idx + 1
+        entry = scanner.entry
+        entry_len = len(entry_view)
+        dn_span = lap_field_span(entry, entry_len, DRIVER_NUMBER_KEY)
+        position_span = lap_field_span(entry, entry_len, POSITION_KEY)
+        if dn_span is None or position_span is None:
+            return
+        try:
+            driver_number = int(lap_field_text(entry_view, dn_span))
+            position = int(lap_field_text(entry_view, position_span))
+        except ValueError:
+            return
+        rank_top_driver(top, (position, idx, driver_number), limit)
+
+    scanner.reset(add_entry)
+    try:
+        feed_lap_tracker(raw_stream, tracker)
+    finally:
+        give_lap_tracker(tracker)
+    return top_driver_numbers(top)
+
+
+def take_batch_lap_tracker(results):
+    """Borrow a pooled tracker whose scanner fills results from batch entries.
+
+    Only each entry's driver_number, lap_duration and lap_number literals
+    are decoded; later entries for a tracked driver replace earlier ones.
+    """
+    tracker = take_lap_tracker()
+    scanner = tracker.scanner
+
+    def add_entry(entry_view):
+        entry = scanner.entry
+        entry_len = len(entry_view)
+        span = lap_field_span(entry, entry_len, DRIVER_NUMBER_KEY)
+        if span is None:
+            return
+        # A malformed literal (e.g. 44.0) skips its entry, not the batch.
+        try:
+            dn = int(lap_field_text(entry_view, span))
+            if dn not in results:
+                return
+            span = lap_field_span(entry, entry_len, LAP_DURATION_KEY)
+            if span is None:
+                return
+            lap_duration = to_millis(lap_field_text(entry_view, span))
+            span = lap_field_span(entry, entry_len, LAP_NUMBER_KEY)
+            lap_number = None if span is None else int(lap_field_text(entry_view, span))
+        except ValueError:
+            return
+        results[dn] = (lap_duration, lap_number)
+
+    scanner.reset(add_entry)
+    return tracker
+
 
-    raise RuntimeError("No lap_duration rows")
+def read_batch_laps(raw_stream, driver_numbers, results=None):
+    """Stream a batch laps response into {driver_number: (ms, lap_number)}.
+
+    results is cleared and reused if given.
+    """
+    results = reset_lap_results({} if results is None else results, driver_numbers)
+    tracker = take_batch_lap_tracker(results)
+    try:
+        feed_lap_tracker(raw_stream, tracker)
+    finally:
+        give_lap_tracker(tracker)
+    return results
+
+
+def fetch_latest_laps_batch(driver_numbers, results=None):
+    """Sync async_fetch_latest_laps_batch over the keep-alive client."""
+    global _batch_laps_supported
+    response = None
+    try:
+        response = _http_client.get(batch_laps_url(driver_numbers))
+        if response.status_code == 404:
+            _batch_laps_supported = False
+        if response.status_code != 200:
+            raise RuntimeError("HTTP {}".format(response.status_code))
+        return read_batch_laps(response_raw_stream(response), driver_numbers, results)
+    finally:
+        if response is not None:
+            response.close()
+
+
+def fetch_lap_results(driver_numbers):
+    """Fetch every driver's latest lap: one batch request when supported.
+
+    Falls back to one request per driver only once the batch endpoint has
+    404'd; a driver whose request fails maps to (None, None).
+    """
+    if _batch_laps_supported:
+        try:
+            return fetch_latest_laps_batch(driver_numbers)
+        except Exception:
+            if _batch_laps_supported:
+                return reset_lap_results({}, driver_numbers)
+
+    results = {}
+    for dn in driver_numbers:
+        try:
+            lap_duration, lap_number, _ = fetch_latest_lap_duration(dn)
+            results[dn] = (lap_duration, lap_number)
+        except Exception:
+            results[dn] = (None, None)
+    return results
 
 
 def fetch_latest_lap_duration(driver_number):
     url = api_url_for_driver(driver_number)
     response = None
-    gc.collect()
     try:
-        response = urequests.get(url, stream=True)
+        response = _http_client.get(url)
         if response.status_code != 200:
             raise RuntimeError("HTTP {}".format(response.status_code))
 
-        raw_stream = getattr(response, "raw", None)
-        if raw_stream is None:
-            raise RuntimeError("No streamed lap response")
-
-        tail = bytearray()
-        while True:
-            chunk = raw_stream.read(HTTP_READ_CHUNK_BYTES)
-            if not chunk:
-                break
-            if not isinstance(chunk, (bytes, bytearray)):
-                chunk = str(chunk).encode("utf-8")
-            tail.extend(chunk)
-            if len(tail) > HTTP_TAIL_BYTES:
-                overflow = len(tail) - HTTP_TAIL_BYTES
-                tail = tail[overflow:]
+        lap_duration, lap_number = read_latest_lap(response_raw_stream(response))
     finally:
         if response is not None:
             response.close()
-        gc.collect()
 
-    if not tail:
-        raise RuntimeError("No lap data")
-
-    tail_text = tail.decode("utf-8", "ignore")
-    lap_duration, lap_number, _ = lap_from_tail_json(tail_text)
     return lap_duration, lap_number, driver_number
 
 
-async def async_fetch_latest_lap_duration(driver_number):
-    url = api_url_for_driver(driver_number)
-    gc.collect()
-    status, reader, writer = await _async_http_get(url)
+async def async_read_stream_tail(response, chunk_bytes=HTTP_READ_CHUNK_BYTES):
+    """Async read_stream_tail: drain response, keeping its last HTTP_TAIL_BYTES."""
+    ring = take_tail_ring()
     try:
-        if status != 200:
-            raise RuntimeError("HTTP {}".format(status))
-
-        tail = bytearray()
+        write_pos = 0
+        total = 0
+        view = memoryview(ring)
+        size = len(ring)
         while True:
-            chunk = await reader.read(HTTP_READ_CHUNK_BYTES)
-            if not chunk:
+            count = await response.readinto(view[write_pos:min(write_pos + chunk_bytes, size)])
+            if not count:
                 break
-            if not isinstance(chunk, (bytes, bytearray)):
-                chunk = str(chunk).encode("utf-8")
-            tail.extend(chunk)
-            if len(tail) > HTTP_TAIL_BYTES:
-                overflow = len(tail) - HTTP_TAIL_BYTES
-                tail = tail[overflow:]
+            total += count
+            write_pos = (write_pos + count) % size
+        return ring_contents(ring, write_pos, total)
     finally:
-        writer.close()
-        gc.collect()
+        give_tail_ring(ring)
 
-    if not tail:
-        raise RuntimeError("No lap data")
 
-    tail_text = tail.decode("utf-8", "ignore")
-    lap_duration, lap_number, _ = lap_from_tail_json(tail_text)
-    return lap_duration, lap_number, driver_number
+async def async_feed_lap_tracker(response, tracker):
+    """Drain an AsyncKeepAliveResponse body into tracker.feed()."""
+    while True:
+        count = await response.readinto(tracker.chunk)
+        if not count:
+            break
+        tracker.feed(tracker.chunk, count, tracker.chunk_view)
 
 
-async def async_fetch_event_and_session_info():
-    global event_name, session_type_name, circuit_short_name, country_name, current_season_year
-    gc.collect()
+async def async_read_latest_lap(response):
+    """Async read_latest_lap over an AsyncKeepAliveResponse."""
+    tracker = take_lap_tracker()
+    try:
+        await async_feed_lap_tracker(response, tracker)
+        return tracker.latest()
+    finally:
+        give_lap_tracker(tracker)
+
 
-    status, reader, writer = await _async_http_get(MEETINGS_URL)
+async def async_fetch_latest_lap_duration(driver_number):
+    """Fetch driver_number's newest completed lap.
+
+    Asks only for laps from the last lap number seen onwards, so each poll
+    downloads a lap or two instead of the whole session. Retries once
+    without that filter when it matches nothing (e.g. a new session).
+    """
+    url = floored_laps_url(driver_number)
+    cached_etag, cached = cached_lap_etag(url)
+    response = await _async_http_client.get(url, cached_etag)
     try:
-        if status != 200:
+        status = response.status_code
+        if status == 304 and cached is not None:
+            lap_duration, lap_number = cached
+        elif status != 200:
             raise RuntimeError("HTTP {}".format(status))
-        body = bytearray()
-        while True:
-            chunk = await reader.read(HTTP_READ_CHUNK_BYTES)
-            if not chunk:
-                break
-            body.extend(chunk)
+        else:
+            try:
+                lap_duration, lap_number = await async_read_latest_lap(response)
+            except RuntimeError:
+                if _lap_number_floor.pop(driver_number, None) is None:
+                    raise
+                lap_duration = None
+            if lap_duration is not None:
+                store_lap_etag(url, response.etag, (lap_duration, lap_number))
     finally:
-        writer.close()
-        gc.collect()
+        response.close()
 
-    payload = json.loads(body.decode("utf-8", "ignore"))
-    current_season_year = int(payload[-1]["year"])
-    event_name = str(payload[-1]["meeting_name"])
-    body = None
-    gc.collect()
+    if lap_duration is None:
+        return await async_fetch_latest_lap_duration(driver_number)
+    if lap_number is None:
+        _lap_number_floor.pop(driver_number, None)
+    else:
+        _lap_number_floor[driver_number] = lap_number
+    return lap_duration, lap_number, driver_number
+
+
+async def async_fetch_lap_results(driver_numbers, results=None):
+    """Fetch every driver's latest lap; requests queue on the poll connection.
 
-    status, reader, writer = await _async_http_get(SESSIONS_URL)
+    Fills and returns results (cleared first) when given, else a new dict.
+    """
+    fetched = await uasyncio.gather(
+        *[async_fetch_latest_lap_duration(dn) for dn in driver_numbers],
+        return_exceptions=True
+    )
+    results = reset_lap_results({} if results is None else results, driver_numbers)
+    for dn, result in zip(driver_numbers, fetched):
+        if not isinstance(result, Exception):
+            lap_duration, lap_number, _ = result
+            results[dn] = (lap_duration, lap_number)
+    return results
+
+
+async def async_read_batch_laps(response, driver_numbers, results=None):
+    """Async read_batch_laps over an AsyncKeepAliveResponse."""
+    results = reset_lap_results({} if results is None else results, driver_numbers)
+    tracker = take_batch_lap_tracker(results)
+    try:
+        await async_feed_lap_tracker(response, tracker)
+    finally:
+        give_lap_tracker(tracker)
+    return results
+
+
+async def async_fetch_latest_laps_batch(driver_numbers, results=None):
+    """Fetch the latest lap for every driver in one request.
+
+    Marks the batch endpoint unsupported on HTTP 404 so callers fall back
+    to per-driver requests.
+    """
+    global _batch_laps_supported
+    url = batch_laps_url(driver_numbers)
+    cached_etag, cached = cached_lap_etag(url)
+    response = await _async_http_client.get(url, cached_etag)
     try:
+        status = response.status_code
+        if status == 304 and cached is not None:
+            results = reset_lap_results({} if results is None else results, driver_numbers)
+            for dn, lap in cached:
+                results[dn] = lap
+            return results
+        if status == 404:
+            _batch_laps_supported = False
         if status != 200:
             raise RuntimeError("HTTP {}".format(status))
-        body = bytearray()
-        while True:
-            chunk = await reader.read(HTTP_READ_CHUNK_BYTES)
-            if not chunk:
-                break
-            body.extend(chunk)
+        results = await async_read_batch_laps(response, driver_numbers, results)
+        store_lap_etag(url, response.etag, tuple(results.items()))
+        return results
     finally:
-        writer.close()
-        gc.collect()
+        response.close()
 
-    payload = json.loads(body.decode("utf-8", "ignore"))
-    session = payload[-1]
+
+async def async_fetch_event_and_session_info():
+    global event_name, session_type_name, circuit_short_name, country_name, current_season_year
+    response = await _async_http_client.get(MEETINGS_URL)
+    try:
+        if response.status_code != 200:
+            raise RuntimeError("HTTP {}".format(response.status_code))
+        tail = await async_read_stream_tail(response)
+    finally:
+        response.close()
+
+    meeting = last_json_object(tail)
+    current_season_year = int(meeting["year"])
+    event_name = str(meeting["meeting_name"])
+    tail = None
+
+    response = await _async_http_client.get(SESSIONS_URL)
+    try:
+        if response.status_code != 200:
+            raise RuntimeError("HTTP {}".format(response.status_code))
+        tail = await async_read_stream_tail(response)
+    finally:
+        response.close()
+
+    session = last_json_object(tail)
     sn = str(session["session_name"])
     session_type_name = sn
     circuit_short_name = str(session["circuit_short_name"])
     country_name = str(session["country_name"])
 
 
-def format_lap_duration(value):
-    total_seconds = float(value)
+def wifi_retry_delay_ms(failures):
+    """Exponential reconnect backoff with +/-25% jitter, capped at WIFI_RETRY_MAX_MS."""
+    delay_ms = min(WIFI_RETRY_MAX_MS, WIFI_RETRY_MIN_MS << min(failures, 6))
+    quarter = delay_ms // 4
+    return delay_ms - quarter + random.getrandbits(16) % (2 * quarter + 1)
 
-    minutes = int(total_seconds // 60)
-    seconds = int(total_seconds % 60)
-    millis = int(round((total_seconds - int(total_seconds)) * 1000))
 
-    if millis == 1000:
-        seconds += 1
-        millis = 0
-    if seconds == 60:
-        minutes += 1
-        seconds = 0
-
-    return "{:02d}:{:02d}.{:03d}".format(minutes, seconds, millis)
+def update_lap_schedule(lap_seen, lap_results, now_ms):
+    """Record when each tracked driver's lap number was first seen to change."""
+    for dn in TRACKED_DRIVERS:
+        lap_result = lap_results.get(dn)
+        if lap_result is None or lap_result[0] is None:
+            continue
+        lap_duration, lap_number = lap_result
+        seen = lap_seen.get(dn)
+        if seen is None or seen[0] != lap_number:
+            lap_seen[dn] = (lap_number, lap_duration, now_ms)
 
 
-def format_gap_to_leader(duration, leader_duration):
-    gap_seconds = float(duration) - leader_duration
-    sign = "+" if gap_seconds >= 0 else "-"
-    gap_seconds = abs(gap_seconds)
+def adaptive_poll_interval_ms(lap_seen, now_ms):
+    """Poll densely around the next expected lap and sparsely otherwise.
 
-    whole_seconds = int(gap_seconds)
-    millis = int(round((gap_seconds - whole_seconds) * 1000))
+    The next lap is expected one lap_duration after the last one was seen.
+    """
+    nearest_ms = None
+    for dn in TRACKED_DRIVERS:
+        seen = lap_seen.get(dn)
+        if seen is None:
+            continue
+        _lap_number, duration_ms, seen_ms = seen
+        remaining_ms = time.ticks_diff(time.ticks_add(seen_ms, duration_ms), now_ms)
+        if remaining_ms < -LAP_EXPECTED_WINDOW_MS:
+            continue
+        if nearest_ms is None or remaining_ms < nearest_ms:
+            nearest_ms = remaining_ms
+
+    if nearest_ms is None:
+        return int(POLL_INTERVAL_SECONDS * 1000)
+    if nearest_ms <= LAP_EXPECTED_WINDOW_MS:
+        return POLL_MIN_INTERVAL_MS
+    return max(POLL_MIN_INTERVAL_MS, min(POLL_MAX_INTERVAL_MS, nearest_ms // 2))
+
+
+def to_millis(value):
+    """Convert a seconds value (number or decimal string) to int milliseconds.
+
+    Decimal strings are converted without touching floats, which are
+    soft-float on the RP2040.
+    """
+    if isinstance(value, int):
+        return value * 1000
+    if isinstance(value, float):
+        return int(round(value * 1000))
+
+    text = str(value).strip()
+    if text.startswith("-"):
+        return -to_millis(text[1:])
+    dot = text.find(".")
+    if dot < 0:
+        return int(text) * 1000
+    digits = text[dot + 1:] + "0000"
+    millis = int(text[:dot] or "0") * 1000 + int(digits[:3])
+    if digits[3] >= "5":
+        millis += 1
+    return millis
+
+
+def format_lap_duration(millis):
+    text = _lap_text_cache.get(millis)
+    if text is None:
+        minutes, rem = divmod(int(millis), 60000)
+        seconds, rem = divmod(rem, 1000)
+        text = "{:02d}:{:02d}.{:03d}".format(minutes, seconds, rem)
+        if len(_lap_text_cache) >= LAP_TEXT_CACHE_LIMIT:
+            _lap_text_cache.clear()
+        _lap_text_cache[millis] = text
+    return text
 
-    if millis == 1000:
-        whole_seconds += 1
-        millis = 0
 
-    return "{}{}.{:03d}".format(sign, whole_seconds, millis)
+def format_gap_to_leader(duration, leader_duration):
+    key = (duration, leader_duration)
+    text = _gap_text_cache.get(key)
+    if text is None:
+        gap_millis = int(duration) - int(leader_duration)
+        sign = "+" if gap_millis >= 0 else "-"
+        whole_seconds, millis = divmod(abs(gap_millis), 1000)
+        text = "{}{}.{:03d}".format(sign, whole_seconds, millis)
+        if len(_gap_text_cache) >= LAP_TEXT_CACHE_LIMIT:
+            _gap_text_cache.clear()
+        _gap_text_cache[key] = text
+    return text
 
 
 def format_lap_number(value):
@@ -1285,7 +2548,11 @@ async def async_main():
 
     wlan = connect_wifi(WIFI_SSID, WIFI_PASSWORD)
 
-    last_lap_results = empty_lap_results()
+    # Collect once per poll cycle below and let the allocator trigger any
+    # extra collections once a quarter of the free heap has been used.
+    gc.collect()
+    gc.threshold(gc.mem_free() // 4 + gc.mem_alloc())
+
     try:
         TRACKED_DRIVERS[:] = fetch_top_session_drivers(TRACKED_DRIVER_COUNT)
     except Exception:
@@ -1296,18 +2563,18 @@ async def async_main():
     except Exception:
         pass
 
-    try:
-        startup_results = {}
-        for dn in TRACKED_DRIVERS:
-            lap_duration, lap_number, _ = fetch_latest_lap_duration(dn)
-            startup_results[dn] = (lap_duration, lap_number)
-        last_lap_results = startup_results
-    except Exception:
-        pass
+    last_lap_results = fetch_lap_results(TRACKED_DRIVERS)
 
     startup_color = GREEN if has_lap_data(last_lap_results) else CYAN
     draw_lap_screen(last_lap_results, startup_color)
 
+    last_lap_fp = lap_results_fingerprint(last_lap_results)
+    # Poll results alternate between two dicts that are refilled in place;
+    # whichever one is not last_lap_results is free for the next poll.
+    lap_buffers = ({}, {})
+    lap_seen = {}
+    update_lap_schedule(lap_seen, last_lap_results, time.ticks_ms())
+
     last_event_info = event_info_snapshot()
     event_info_refresh_ms = int(EVENT_INFO_REFRESH_SECONDS * 1000)
     if event_info_is_complete():
@@ -1316,24 +2583,39 @@ async def async_main():
         next_event_info_refresh_ms = time.ticks_ms()
 
     uasyncio.create_task(_check_buttons_task())
+    wifi_failures = 0
 
     while True:
         handled_button, last_lap_results = _handle_pending_button(last_lap_results)
         if handled_button:
+            last_lap_fp = lap_results_fingerprint(last_lap_results)
             await uasyncio.sleep_ms(20)
             continue
 
         if not wlan.isconnected():
             try:
-                wlan = connect_wifi(WIFI_SSID, WIFI_PASSWORD)
+                wlan = connect_wifi(WIFI_SSID, WIFI_PASSWORD, cancel_on_button=True)
+                wifi_failures = 0
             except Exception:
                 empty_results = empty_lap_results()
-                if empty_results != last_lap_results:
+                empty_fp = lap_results_fingerprint(empty_results)
+                if empty_fp != last_lap_fp:
                     draw_lap_screen(empty_results, CYAN)
                     last_lap_results = empty_results
-                await uasyncio.sleep(1)
+                    last_lap_fp = empty_fp
+                if _button_pressed is None:
+                    try:
+                        await uasyncio.wait_for_ms(
+                            _button_event.wait(),
+                            wifi_retry_delay_ms(wifi_failures),
+                        )
+                        _button_event.clear()
+                    except uasyncio.TimeoutError:
+                        pass
+                    wifi_failures += 1
                 continue
 
+        gc.collect()
         current_event_info = last_event_info
         if time.ticks_diff(time.ticks_ms(), next_event_info_refresh_ms) >= 0:
             try:
@@ -1346,42 +2628,49 @@ async def async_main():
                 event_info_refresh_ms,
             )
 
-        lap_results = {}
-        skip_fetch_cycle = False
-        for dn in TRACKED_DRIVERS:
-            handled_button, last_lap_results = _handle_pending_button(last_lap_results)
-            if handled_button:
-                skip_fetch_cycle = True
-                break
-
+        spare = lap_buffers[1] if last_lap_results is lap_buffers[0] else lap_buffers[0]
+        lap_results = None
+        if _batch_laps_supported:
             try:
-                lap_duration, lap_number, _ = await async_fetch_latest_lap_duration(dn)
-                lap_results[dn] = (lap_duration, lap_number)
+                lap_results = await async_fetch_latest_laps_batch(TRACKED_DRIVERS, spare)
             except Exception:
-                lap_results[dn] = (None, None)
+                if _batch_laps_supported:
+                    lap_results = reset_lap_results(spare, TRACKED_DRIVERS)
+
+        if lap_results is None:
+            lap_results = await async_fetch_lap_results(list(TRACKED_DRIVERS), spare)
 
-        if skip_fetch_cycle:
+        handled_button, last_lap_results = _handle_pending_button(last_lap_results)
+        if handled_button:
+            last_lap_fp = lap_results_fingerprint(last_lap_results)
             continue
 
-        if has_lap_data(lap_results):
-            if lap_results != last_lap_results or current_event_info != last_event_info:
-                draw_lap_screen(lap_results, GREEN)
-                last_lap_results = lap_results
-                last_event_info = current_event_info
-        else:
-            empty_results = empty_lap_results()
-            if empty_results != last_lap_results or current_event_info != last_event_info:
-                draw_lap_screen(empty_results, CYAN)
-                last_lap_results = empty_results
-                last_event_info = current_event_info
-
-        poll_deadline = time.ticks_add(time.ticks_ms(), int(POLL_INTERVAL_SECONDS * 1000))
-        while time.ticks_diff(poll_deadline, time.ticks_ms()) > 0:
+        if not has_lap_data(lap_results):
+            reset_lap_results(lap_results, TRACKED_DRIVERS)
+        lap_fp = lap_results_fingerprint(lap_results)
+        if lap_fp != last_lap_fp or current_event_info != last_event_info:
+            draw_lap_screen(lap_results, GREEN if has_lap_data(lap_results) else CYAN)
+            last_lap_results = lap_results
+            last_lap_fp = lap_fp
+            last_event_info = current_event_info
+
+        now_ms = time.ticks_ms()
+        update_lap_schedule(lap_seen, lap_results, now_ms)
+        poll_interval_ms = adaptive_poll_interval_ms(lap_seen, now_ms)
+        poll_deadline = time.ticks_add(now_ms, poll_interval_ms)
+        while True:
+            remaining_ms = time.ticks_diff(poll_deadline, time.ticks_ms())
+            if remaining_ms <= 0:
+                break
+            try:
+                await uasyncio.wait_for_ms(_button_event.wait(), remaining_ms)
+            except uasyncio.TimeoutError:
+                break
+            _button_event.clear()
             handled_button, last_lap_results = _handle_pending_button(last_lap_results)
             if handled_button:
-                poll_deadline = time.ticks_add(time.ticks_ms(), int(POLL_INTERVAL_SECONDS * 1000))
-                continue
-            await uasyncio.sleep_ms(20)
+                last_lap_fp = lap_results_fingerprint(last_lap_results)
+                poll_deadline = time.ticks_add(time.ticks_ms(), poll_interval_ms)
 
 
 uasyncio.run(async_main())